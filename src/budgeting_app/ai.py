@@ -2,36 +2,202 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import re
-from dataclasses import dataclass
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Callable, Iterable, List, Optional, Sequence, Tuple
 
 from .models import Transaction
 
-try:  # pragma: no cover - optional dependency error classes vary by version
-    from openai import OpenAI
-    from openai import APIError as _APIError  # type: ignore
-    from openai import OpenAIError as _OpenAIError  # type: ignore
-    _LEGACY_OPENAI = None
-except Exception:  # pragma: no cover - OpenAI not available during type checking
-    OpenAI = None  # type: ignore
-    try:
-        import openai as _LEGACY_OPENAI  # type: ignore
-        from openai.error import OpenAIError as _OpenAIError  # type: ignore
-        try:  # pragma: no cover - APIError was added in later 0.x releases
-            from openai.error import APIError as _APIError  # type: ignore
-        except Exception:  # pragma: no cover - fall back to base error
-            _APIError = _OpenAIError  # type: ignore
-    except Exception:  # pragma: no cover - legacy SDK also missing
-        _LEGACY_OPENAI = None
-
-        class _OpenAIError(Exception):
-            """Fallback error when the OpenAI SDK is unavailable."""
-
-        class _APIError(_OpenAIError):
-            """Fallback error for compatibility with SDK signatures."""
+try:  # pragma: no cover - optional faster JSON decoder for model responses
+    import orjson as _orjson  # type: ignore
+
+    _json_loads = _orjson.loads
+except Exception:  # pragma: no cover - fall back to the standard library
+    _json_loads = json.loads
+
+try:  # pragma: no cover - optional accelerator for keyword heuristics
+    import ahocorasick as _ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - fall back to plain substring checks
+    _ahocorasick = None
+
+# The OpenAI SDK pulls in a sizeable dependency tree, so it is imported on
+# first use (and only when an API key is configured) to keep start-up fast.
+_openai_module: object | None = None
+_openai_import_failed = False
+
+
+class _OpenAIUnavailableError(Exception):
+    """Placeholder error used when the OpenAI SDK has not been imported."""
+
+
+def _load_openai() -> object | None:
+    """Import the OpenAI SDK on first use; return ``None`` when it is unavailable."""
+
+    global _openai_module, _openai_import_failed
+    if _openai_module is None and not _openai_import_failed:
+        try:
+            import openai  # type: ignore
+        except Exception:  # pragma: no cover - optional dependency missing
+            _openai_import_failed = True
+        else:
+            _openai_module = openai
+    return _openai_module
+
+
+def _openai_errors() -> Tuple[type, ...]:
+    """Return the SDK's API error classes for use in ``except`` clauses."""
+
+    module = _openai_module
+    if module is None:
+        return (_OpenAIUnavailableError,)
+    errors = []
+    for name in ("APIError", "OpenAIError"):
+        # 1.x exports the errors at the top level; 0.x keeps them in openai.error.
+        error = getattr(module, name, None) or getattr(getattr(module, "error", None), name, None)
+        if isinstance(error, type):
+            errors.append(error)
+    return tuple(errors) or (_OpenAIUnavailableError,)
+
+
+_TOKEN_RE = re.compile(r"[^a-z0-9]+")
+_WS_RE = re.compile(r"\s+")
+# Maps ASCII letters to lowercase, keeps digits and turns everything else into spaces.
+_ASCII_TOKEN_TABLE = str.maketrans(
+    {
+        code: (chr(code).lower() if chr(code).isalnum() else " ")
+        for code in range(128)
+    }
+)
+
+# Keyword heuristics derived from publicly available data. The first entry whose
+# keyword appears in a transaction wins.
+_KEYWORD_MAP: Tuple[Tuple[str, str], ...] = (
+    ("grocery", "Groceries"),
+    ("supermarket", "Groceries"),
+    ("aldi", "Groceries"),
+    ("lidl", "Groceries"),
+    ("tesco", "Groceries"),
+    ("rent", "Rent"),
+    ("mortgage", "Housing"),
+    ("uber", "Transport"),
+    ("lyft", "Transport"),
+    ("taxi", "Transport"),
+    ("fuel", "Auto & Transport"),
+    ("petrol", "Auto & Transport"),
+    ("shell", "Auto & Transport"),
+    ("bp", "Auto & Transport"),
+    ("starbucks", "Dining"),
+    ("coffee", "Dining"),
+    ("restaurant", "Dining"),
+    ("dining", "Dining"),
+    ("salary", "Income"),
+    ("payroll", "Income"),
+    ("bonus", "Income"),
+    ("electric", "Utilities"),
+    ("internet", "Utilities"),
+    ("broadband", "Utilities"),
+    ("water", "Utilities"),
+    ("insurance", "Insurance"),
+    ("pharmacy", "Healthcare"),
+    ("chemist", "Healthcare"),
+    ("gym", "Health & Fitness"),
+    ("fitness", "Health & Fitness"),
+)
+
+
+# Flat, index-aligned views of _KEYWORD_MAP: keyword text, plus the index of its
+# category in _KEYWORD_CATEGORIES (distinct names, in map order).
+_KEYWORDS: Tuple[str, ...] = tuple(keyword for keyword, _category_name in _KEYWORD_MAP)
+_KEYWORD_CATEGORIES: Tuple[str, ...] = tuple(
+    dict.fromkeys(category_name for _keyword, category_name in _KEYWORD_MAP)
+)
+_KEYWORD_CATEGORY_INDEX: Tuple[int, ...] = tuple(
+    _KEYWORD_CATEGORIES.index(category_name) for _keyword, category_name in _KEYWORD_MAP
+)
+
+
+# Without pyahocorasick the keywords are probed with ``in`` one at a time. For a
+# table this small that is faster than a combined ``re`` alternation, which can
+# only report overlapping hits through a lookahead and a match object per hit.
+@lru_cache(maxsize=1)
+def _keyword_automaton() -> object | None:
+    """Compile the keyword heuristics into an Aho-Corasick automaton if available.
+
+    Built on first use and shared by every classifier instance, so launching the
+    app without needing the heuristics does not pay for it.
+    """
+
+    if _ahocorasick is None:
+        return None
+    automaton = _ahocorasick.Automaton()
+    for position, keyword in enumerate(_KEYWORDS):
+        automaton.add_word(keyword, position)
+    automaton.make_automaton()
+    return automaton
+
+
+# Few-shot descriptions are truncated to keep prompt tokens per request down.
+_EXAMPLE_DESCRIPTION_LIMIT = 60
+
+_CLASSIFICATION_PROPERTIES = {
+    "category": {"type": "string"},
+    "confidence": {"type": "number"},
+}
+
+# Structured-output schemas; the SDK then guarantees the reply is valid JSON.
+_SINGLE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "classification",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": _CLASSIFICATION_PROPERTIES,
+            "required": ["category", "confidence"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "classifications",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "index": {"type": "integer"},
+                            **_CLASSIFICATION_PROPERTIES,
+                        },
+                        "required": ["index", "category", "confidence"],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["results"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_SYSTEM_PROMPT = (
+    "You categorise personal finance transactions for a budgeting app. "
+    "Return concise JSON only. Prefer categories that already exist "
+    "and be consistent with prior assignments."
+)
 
 
 class _LegacyChatCompletionClient:
@@ -44,7 +210,222 @@ class _LegacyChatCompletionClient:
         return self._module.ChatCompletion.create(**kwargs)
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=32)
+def _lowered_categories(
+    existing_categories: Tuple[str, ...],
+) -> Tuple[dict[str, str], Tuple[Tuple[str, str], ...]]:
+    """Lowercase each category name once: an exact-match map plus ordered pairs."""
+
+    pairs = tuple((name.lower(), name) for name in existing_categories if name)
+    exact: dict[str, str] = {}
+    for lowered, name in pairs:
+        exact.setdefault(lowered, name)
+    return exact, pairs
+
+
+@lru_cache(maxsize=256)
+def _resolve_category_name(suggestion: str, existing_categories: Tuple[str, ...]) -> str:
+    """Adjust a heuristic suggestion to match an existing category name."""
+
+    exact, pairs = _lowered_categories(existing_categories)
+    suggestion_lower = suggestion.lower()
+    match = exact.get(suggestion_lower)
+    if match is not None:
+        return match
+    for lowered, name in pairs:
+        if suggestion_lower in lowered or lowered in suggestion_lower:
+            return name
+    return suggestion
+
+
+# Transactions are re-classified on every AI refresh, so the lowered text derived
+# from their fields is cached. The field strings are the same objects each time,
+# and their hashes are cached too, so a lookup is much cheaper than redoing the work.
+@lru_cache(maxsize=4096)
+def _normalise_fields(*parts: Optional[str]) -> str:
+    """Join, lowercase and collapse whitespace in the given fields."""
+
+    text = " ".join(part for part in parts if part)
+    return _WS_RE.sub(" ", text.strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def _tokenise_fields(*parts: Optional[str]) -> frozenset[str]:
+    """Split the given fields into lowercase alphanumeric tokens."""
+
+    text = " ".join(part for part in parts if part)
+    if not text:
+        return frozenset()
+    if text.isascii():
+        # Lowercase and split on non-alphanumerics in one C-level pass.
+        return frozenset(text.translate(_ASCII_TOKEN_TABLE).split())
+    tokens = _TOKEN_RE.split(text.lower())
+    return frozenset(token for token in tokens if token)
+
+
+@lru_cache(maxsize=4096)
+def _keyword_haystack(description: str, counterparty: str, reference: str) -> str:
+    """Return the lowered text scanned by the keyword heuristics."""
+
+    # Keywords never contain spaces, so padding for missing fields is harmless.
+    return f"{description} {counterparty} {reference}".lower()
+
+
+def _transaction_fields(transaction: Transaction) -> Tuple[str, str, str, str, str]:
+    """Return the prompt-relevant fields of a transaction as a hashable tuple."""
+
+    return (
+        transaction.description or "",
+        str(transaction.amount),
+        transaction.counterparty or "",
+        transaction.account_name or transaction.account_id or "",
+        transaction.reference or "",
+    )
+
+
+def _describe_fields(fields: Tuple[str, str, str, str, str]) -> List[str]:
+    """Format transaction fields as ``Label: value`` prompt fragments."""
+
+    description, amount, counterparty, account, reference = fields
+    parts = [
+        f"Description: {description or '-'}",
+        f"Amount: {amount}",
+    ]
+    if counterparty:
+        parts.append(f"Counterparty: {counterparty}")
+    if account:
+        parts.append(f"Account: {account}")
+    if reference:
+        parts.append(f"Reference: {reference}")
+    return parts
+
+
+def _describe_transaction(transaction: Transaction) -> str:
+    """Describe a transaction to classify, including the date it occurred."""
+
+    parts = _describe_fields(_transaction_fields(transaction))
+    parts.append(f"Occurred On: {transaction.occurred_on}")
+    return "; ".join(parts)
+
+
+def _compact_example(fields: Tuple[str, str, str, str, str], category_name: str) -> str:
+    """Render a few-shot example as a short ``description -> category`` line.
+
+    The description is what discriminates the label, so the remaining fields are
+    only spelled out when it is missing.
+    """
+
+    description = fields[0]
+    if not description:
+        parts = _describe_fields(fields)
+        parts.append(f"Category: {category_name}")
+        return "; ".join(parts)
+    if len(description) > _EXAMPLE_DESCRIPTION_LIMIT:
+        description = description[:_EXAMPLE_DESCRIPTION_LIMIT].rstrip() + "..."
+    return f"{description} -> {category_name}"
+
+
+@lru_cache(maxsize=8)
+def _build_prompt_header(
+    category_names: Tuple[str, ...],
+    example_rows: Tuple[Tuple[Tuple[str, str, str, str, str], str], ...],
+) -> str:
+    """Describe the known categories and few-shot examples for a prompt.
+
+    The header is identical for every transaction classified against the same
+    categories and examples, so it is cached across calls.
+    """
+
+    category_section = ", ".join(category_names) if category_names else "(no existing categories)"
+
+    example_lines = [_compact_example(fields, category_name) for fields, category_name in example_rows]
+    examples_section = "\n".join(example_lines) if example_lines else "(no prior examples)"
+
+    return (
+        "The budgeting app currently has the following categories: "
+        f"{category_section}.\n"
+        "Here are previously labelled transactions as \"description -> category\" "
+        "(use them as few-shot learning examples):\n"
+        f"{examples_section}\n\n"
+    )
+
+
+def _next_json_start(message: str, offset: int) -> int:
+    """Return the index of the next ``{`` or ``[`` at or after ``offset`` (or -1)."""
+
+    starts = [index for index in (message.find("{", offset), message.find("[", offset)) if index != -1]
+    return min(starts) if starts else -1
+
+
+def _json_span_end(message: str, start: int) -> Optional[int]:
+    """Return the index just past the bracket that closes ``message[start]``.
+
+    Brackets inside JSON strings are ignored, so a single linear scan finds the
+    end of the value without regex backtracking over long completions.
+    """
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(message)):
+        char = message[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return None
+
+
+class _LRUCache(OrderedDict):
+    """Ordered mapping that evicts the least recently used entry past ``maxsize``."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):  # type: ignore[no-untyped-def]
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value) -> None:  # type: ignore[no-untyped-def]
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class _RequestThrottle:
+    """Space out asynchronous API requests to honour a requests-per-minute limit."""
+
+    def __init__(self, requests_per_minute: Optional[int]) -> None:
+        self._interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass(frozen=True, slots=True)
 class ClassificationResult:
     """Represents the classifier's output for a transaction."""
 
@@ -52,6 +433,18 @@ class ClassificationResult:
     confidence: float
 
 
+@dataclass(slots=True)
+class BulkClassificationJob:
+    """Handle for a classification request submitted to the OpenAI Batch API."""
+
+    batch_id: str
+    memory_keys: dict[str, str] = field(default_factory=dict)
+    status: str = "validating"
+
+
+_PENDING_BATCH_STATUSES = frozenset({"validating", "in_progress", "finalizing", "cancelling"})
+
+
 class TransactionClassifier:
     """Generate transaction category suggestions using ChatGPT."""
 
@@ -61,37 +454,41 @@ class TransactionClassifier:
         model: str = "gpt-4o-mini",
         temperature: float = 0.2,
         max_feedback_examples: int = 12,
+        batch_size: int = 20,
+        memory_size: int = 4096,
+        structured_outputs: bool = True,
     ) -> None:
         self.model = model
         self.temperature = temperature
         self.max_feedback_examples = max_feedback_examples
-        self._memory: dict[str, ClassificationResult] = {}
+        self.batch_size = max(1, batch_size)
+        self.structured_outputs = structured_outputs
+        self._memory: _LRUCache[str, ClassificationResult] = _LRUCache(max(1, memory_size))
+        # Inverted index over the current few-shot window: token -> positions.
+        self._example_window: List[Tuple[Transaction, str]] = []
+        self._example_signature: List[Tuple[int, str]] = []
+        self._example_index: dict[str, List[int]] = {}
+        self._example_tokens: dict[int, frozenset[str]] = {}
+        # Worker threads share the memory and example index; guard every access.
+        self._state_lock = threading.RLock()
         api_key = os.getenv("OPENAI_API_KEY")
         self._legacy_client: Optional[_LegacyChatCompletionClient] = None
         self._using_legacy_sdk = False
-        if OpenAI:
+        self._client = None
+        openai_module = _load_openai() if api_key else None
+        client_cls = getattr(openai_module, "OpenAI", None)
+        if client_cls is not None:
             try:
-                # Newer SDKs automatically pick up the environment variable when no key is passed.
-                self._client = OpenAI(api_key=api_key) if api_key else OpenAI()
+                self._client = client_cls(api_key=api_key)
             except TypeError:
                 # Older 1.x builds may not accept the api_key kwarg; fall back to env configuration.
-                self._client = OpenAI()
+                self._client = client_cls()
             except Exception:
                 self._client = None
-        else:
-            self._client = None
-        if not self._client and _LEGACY_OPENAI is not None:
-            if api_key:
-                _LEGACY_OPENAI.api_key = api_key
-            elif getattr(_LEGACY_OPENAI, "api_key", None):
-                pass
-            else:
-                env_key = os.getenv("OPENAI_API_KEY")
-                if env_key:
-                    _LEGACY_OPENAI.api_key = env_key
-            if getattr(_LEGACY_OPENAI, "api_key", None):
-                self._legacy_client = _LegacyChatCompletionClient(_LEGACY_OPENAI)
-                self._using_legacy_sdk = True
+        elif openai_module is not None:
+            openai_module.api_key = api_key
+            self._legacy_client = _LegacyChatCompletionClient(openai_module)
+            self._using_legacy_sdk = True
         self._warned_missing_client = False
         self._warned_legacy_mode = False
 
@@ -123,29 +520,15 @@ class TransactionClassifier:
         self._update_memory(examples)
 
         normalised_key = self._normalise_transaction(transaction)
-        if normalised_key and normalised_key in self._memory:
+        memoised = self._recall(normalised_key)
+        if memoised is not None:
             if logger:
                 logger("Using memoised classification for recurring transaction.")
-            return self._memory[normalised_key]
+            return memoised
 
         if not self._client and not self._legacy_client:
             # No API client configured; we can still benefit from memoised feedback.
-            if logger:
-                logger(
-                    "OpenAI client is not configured; using heuristic fallback classifier."
-                )
-                if not self._warned_missing_client:
-                    logger(
-                        "Set the OPENAI_API_KEY environment variable before launching the app to "
-                        "enable ChatGPT-backed categorisation."
-                    )
-                    logger(
-                        "Example (PowerShell): setx OPENAI_API_KEY 'sk-...' and restart the app."
-                    )
-                    logger(
-                        "Example (macOS/Linux): export OPENAI_API_KEY='sk-...' before running the app."
-                    )
-                    self._warned_missing_client = True
+            self._log_missing_client(logger)
             fallback = self._heuristic_classification(
                 transaction,
                 categories,
@@ -166,44 +549,10 @@ class TransactionClassifier:
         try:
             if logger:
                 logger(f"Requesting classification from model '{self.model}'.")
-            if self._legacy_client is not None:
-                if logger and not self._warned_legacy_mode:
-                    logger(
-                        "Detected legacy OpenAI SDK; using ChatCompletion API for compatibility."
-                    )
-                    self._warned_legacy_mode = True
-                response = self._legacy_client.create(
-                    model=self.model,
-                    temperature=self.temperature,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": (
-                                "You categorise personal finance transactions for a budgeting app. "
-                                "Return concise JSON only. Prefer categories that already exist "
-                                "and be consistent with prior assignments."
-                            ),
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                )
-            else:
-                response = self._client.chat.completions.create(  # type: ignore[call-arg]
-                    model=self.model,
-                    temperature=self.temperature,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": (
-                                "You categorise personal finance transactions for a budgeting app. "
-                                "Return concise JSON only. Prefer categories that already exist "
-                                "and be consistent with prior assignments."
-                            ),
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                )
-        except (_APIError, _OpenAIError) as exc:  # pragma: no cover - network failure path
+            response = self._create_completion(
+                prompt, _SINGLE_RESPONSE_FORMAT, logger=logger
+            )
+        except _openai_errors() as exc:  # pragma: no cover - network failure path
             if logger:
                 logger(f"OpenAI API error: {exc}")
             return self._heuristic_classification(
@@ -227,8 +576,8 @@ class TransactionClassifier:
             )
 
         result = self._parse_response(content)
-        if result and normalised_key:
-            self._memory[normalised_key] = result
+        if result:
+            self._remember(normalised_key, result)
         if not result:
             if logger:
                 logger("Failed to parse a valid classification result from the model response.")
@@ -247,9 +596,520 @@ class TransactionClassifier:
             )
         return result
 
+    def suggest_categories(
+        self,
+        transactions: Sequence[Transaction],
+        existing_categories: Iterable[str],
+        categorized_examples: Sequence[Tuple[Transaction, str]],
+        *,
+        logger: Optional[Callable[[str], None]] = None,
+    ) -> List[Optional[ClassificationResult]]:
+        """Classify several transactions, packing up to ``batch_size`` per request.
+
+        The returned list is aligned with ``transactions``; entries are ``None``
+        when no category could be inferred for the matching transaction.
+        """
+
+        transactions = list(transactions)
+        categories = list(existing_categories)
+        examples = list(categorized_examples)
+        results: List[Optional[ClassificationResult]] = [None] * len(transactions)
+        if not transactions:
+            return results
+        if not categories and not examples:
+            if logger:
+                logger(
+                    "Skipping classification: no existing categories or labelled examples available."
+                )
+            return results
+
+        self._update_memory(examples)
+
+        keys, pending = self._recall_memoised(transactions, results, logger=logger)
+        if not pending:
+            return results
+
+        if not self._client and not self._legacy_client:
+            # Classify the whole batch in one loop so the category and example
+            # lists are copied and indexed once rather than once per transaction.
+            self._log_missing_client(logger)
+            category_names = tuple(categories)
+            for index in pending:
+                results[index] = self._heuristic_classification(
+                    transactions[index],
+                    category_names,
+                    examples,
+                    normalised_key=keys[index],
+                    logger=logger,
+                )
+                if results[index] and logger:
+                    logger(
+                        "Heuristic engine suggested category '{name}' with confidence "
+                        "{confidence:.2f}.".format(
+                            name=results[index].category_name,
+                            confidence=results[index].confidence,
+                        )
+                    )
+            return results
+
+        header = self._build_prompt_context(categories, examples)
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start : start + self.batch_size]
+            batch = [transactions[index] for index in chunk]
+            prompt = self._build_batch_prompt(batch, categories, examples, header=header)
+            parsed: dict[int, ClassificationResult] = {}
+            try:
+                if logger:
+                    logger(
+                        f"Requesting classification of {len(batch)} transaction(s) "
+                        f"from model '{self.model}'."
+                    )
+                response = self._create_completion(
+                    prompt, _BATCH_RESPONSE_FORMAT, logger=logger
+                )
+            except _openai_errors() as exc:  # pragma: no cover - network failure path
+                if logger:
+                    logger(f"OpenAI API error: {exc}")
+            else:
+                parsed = self._parse_batch_content(response, len(batch), logger=logger)
+            self._store_batch_results(
+                chunk, parsed, transactions, keys, categories, examples, results, logger=logger
+            )
+        return results
+
+    async def suggest_categories_async(
+        self,
+        transactions: Sequence[Transaction],
+        existing_categories: Iterable[str],
+        categorized_examples: Sequence[Tuple[Transaction, str]],
+        *,
+        concurrency: int = 4,
+        requests_per_minute: Optional[int] = None,
+        logger: Optional[Callable[[str], None]] = None,
+        on_result: Optional[Callable[[int, Optional[ClassificationResult]], None]] = None,
+    ) -> List[Optional[ClassificationResult]]:
+        """Classify transactions with up to ``concurrency`` batch requests in flight.
+
+        ``requests_per_minute`` optionally spaces out request starts so large
+        imports stay within the account's rate limit. ``on_result`` is called
+        once per transaction index, on the event loop, as soon as its batch
+        completes.
+        """
+
+        client = self._new_async_client()
+        if client is None:
+            return await self._suggest_in_thread(
+                transactions,
+                existing_categories,
+                categorized_examples,
+                logger=logger,
+                on_result=on_result,
+            )
+        # The client's connection pool belongs to the running loop, so it lives
+        # for this call only.
+        try:
+            return await self._suggest_with_async_client(
+                client,
+                transactions,
+                existing_categories,
+                categorized_examples,
+                concurrency=concurrency,
+                requests_per_minute=requests_per_minute,
+                logger=logger,
+                on_result=on_result,
+            )
+        finally:
+            await client.close()
+
+    async def _suggest_in_thread(
+        self,
+        transactions: Sequence[Transaction],
+        existing_categories: Iterable[str],
+        categorized_examples: Sequence[Tuple[Transaction, str]],
+        *,
+        logger: Optional[Callable[[str], None]],
+        on_result: Optional[Callable[[int, Optional[ClassificationResult]], None]],
+    ) -> List[Optional[ClassificationResult]]:
+        """Run the blocking classifier one batch at a time off the event loop."""
+
+        transactions = list(transactions)
+        categories = tuple(existing_categories)
+        examples = list(categorized_examples)
+        results: List[Optional[ClassificationResult]] = []
+        if not categories and not examples:
+            if logger:
+                logger(
+                    "Skipping classification: no existing categories or labelled examples available."
+                )
+            if on_result:
+                for index in range(len(transactions)):
+                    on_result(index, None)
+            return [None] * len(transactions)
+        for start in range(0, len(transactions), self.batch_size):
+            batch_results = await asyncio.to_thread(
+                self.suggest_categories,
+                transactions[start : start + self.batch_size],
+                categories,
+                examples,
+                logger=logger,
+            )
+            if on_result:
+                for offset, result in enumerate(batch_results):
+                    on_result(start + offset, result)
+            results.extend(batch_results)
+        return results
+
+    async def _suggest_with_async_client(
+        self,
+        client: object,
+        transactions: Sequence[Transaction],
+        existing_categories: Iterable[str],
+        categorized_examples: Sequence[Tuple[Transaction, str]],
+        *,
+        concurrency: int,
+        requests_per_minute: Optional[int],
+        logger: Optional[Callable[[str], None]],
+        on_result: Optional[Callable[[int, Optional[ClassificationResult]], None]],
+    ) -> List[Optional[ClassificationResult]]:
+        transactions = list(transactions)
+        categories = list(existing_categories)
+        examples = list(categorized_examples)
+        results: List[Optional[ClassificationResult]] = [None] * len(transactions)
+        if not transactions:
+            return results
+        if not categories and not examples:
+            if logger:
+                logger(
+                    "Skipping classification: no existing categories or labelled examples available."
+                )
+            if on_result:
+                for index in range(len(transactions)):
+                    on_result(index, None)
+            return results
+
+        self._update_memory(examples)
+
+        keys, pending = self._recall_memoised(transactions, results, logger=logger)
+        if on_result:
+            for index, result in enumerate(results):
+                if result is not None:
+                    on_result(index, result)
+        if not pending:
+            return results
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        throttle = _RequestThrottle(requests_per_minute)
+        memory_lock = asyncio.Lock()
+        header = self._build_prompt_context(categories, examples)
+
+        async def classify_chunk(chunk: List[int]) -> None:
+            batch = [transactions[index] for index in chunk]
+            prompt = self._build_batch_prompt(batch, categories, examples, header=header)
+            parsed: dict[int, ClassificationResult] = {}
+            async with semaphore:
+                await throttle.wait()
+                try:
+                    if logger:
+                        logger(
+                            f"Requesting classification of {len(batch)} transaction(s) "
+                            f"from model '{self.model}'."
+                        )
+                    response = await client.chat.completions.create(
+                        **self._completion_request(prompt, _BATCH_RESPONSE_FORMAT)
+                    )
+                except _openai_errors() as exc:  # pragma: no cover - network failure path
+                    if logger:
+                        logger(f"OpenAI API error: {exc}")
+                else:
+                    parsed = self._parse_batch_content(response, len(batch), logger=logger)
+            async with memory_lock:
+                self._store_batch_results(
+                    chunk, parsed, transactions, keys, categories, examples, results, logger=logger
+                )
+            if on_result:
+                for index in chunk:
+                    on_result(index, results[index])
+
+        await asyncio.gather(
+            *(
+                classify_chunk(pending[start : start + self.batch_size])
+                for start in range(0, len(pending), self.batch_size)
+            )
+        )
+        return results
+
+    def submit_bulk_classification(
+        self,
+        transactions: Sequence[Transaction],
+        existing_categories: Iterable[str],
+        categorized_examples: Sequence[Tuple[Transaction, str]],
+        *,
+        logger: Optional[Callable[[str], None]] = None,
+    ) -> Optional[BulkClassificationJob]:
+        """Queue uncached transactions on the OpenAI Batch API.
+
+        Batch jobs are cheaper than interactive requests but may take up to
+        24 hours; use :meth:`poll_bulk_classification` to collect the results.
+        """
+
+        if self._client is None or self._legacy_client is not None:
+            if logger:
+                logger("Bulk classification requires the OpenAI Python SDK 1.x and an API key.")
+            return None
+        categories = list(existing_categories)
+        examples = list(categorized_examples)
+        if not categories and not examples:
+            if logger:
+                logger(
+                    "Skipping classification: no existing categories or labelled examples available."
+                )
+            return None
+
+        self._update_memory(examples)
+
+        header = self._build_prompt_context(categories, examples)
+        memory_keys: dict[str, str] = {}
+        seen_keys: set[str] = set()
+        lines: List[str] = []
+        for txn in transactions:
+            key = self._normalise_transaction(txn)
+            if not key or key in seen_keys or self._recall(key) is not None:
+                continue
+            seen_keys.add(key)
+            memory_keys[txn.transaction_id] = key
+            request = {
+                "custom_id": txn.transaction_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._completion_request(
+                    self._build_prompt(txn, categories, examples, header=header),
+                    _SINGLE_RESPONSE_FORMAT,
+                ),
+            }
+            lines.append(json.dumps(request))
+        if not lines:
+            if logger:
+                logger("All transactions already have memoised classifications.")
+            return None
+
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".jsonl", delete=False, encoding="utf-8"
+        ) as handle:
+            handle.write("\n".join(lines) + "\n")
+            request_path = handle.name
+        try:
+            with open(request_path, "rb") as upload:
+                batch_file = self._client.files.create(file=upload, purpose="batch")
+            batch = self._client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+        except _openai_errors() as exc:  # pragma: no cover - network failure path
+            if logger:
+                logger(f"OpenAI API error: {exc}")
+            return None
+        finally:
+            os.unlink(request_path)
+
+        if logger:
+            logger(f"Submitted {len(lines)} transaction(s) for bulk classification ({batch.id}).")
+        return BulkClassificationJob(
+            batch_id=batch.id,
+            memory_keys=memory_keys,
+            status=getattr(batch, "status", "validating") or "validating",
+        )
+
+    def poll_bulk_classification(
+        self,
+        job: BulkClassificationJob,
+        *,
+        logger: Optional[Callable[[str], None]] = None,
+    ) -> Optional[dict[str, ClassificationResult]]:
+        """Return results keyed by transaction id, or ``None`` while the job is pending.
+
+        Completed results are memoised so later classification runs reuse them.
+        """
+
+        if self._client is None:
+            return {}
+        try:
+            batch = self._client.batches.retrieve(job.batch_id)
+        except _openai_errors() as exc:  # pragma: no cover - network failure path
+            if logger:
+                logger(f"OpenAI API error: {exc}")
+            return None
+        job.status = getattr(batch, "status", "") or ""
+        if job.status in _PENDING_BATCH_STATUSES:
+            return None
+
+        output_file_id = getattr(batch, "output_file_id", None)
+        if job.status != "completed" or not output_file_id:
+            if logger:
+                logger(f"Bulk classification ended with status '{job.status}'.")
+            return {}
+        try:
+            output = self._client.files.content(output_file_id).text
+        except _openai_errors() as exc:  # pragma: no cover - network failure path
+            if logger:
+                logger(f"OpenAI API error: {exc}")
+            return None
+
+        results: dict[str, ClassificationResult] = {}
+        for line in output.splitlines():
+            try:
+                record = _json_loads(line)
+                custom_id = record["custom_id"]
+                content = record["response"]["body"]["choices"][0]["message"]["content"]
+            except (json.JSONDecodeError, KeyError, IndexError, TypeError):
+                continue
+            result = self._parse_response(content or "")
+            if not result:
+                continue
+            results[custom_id] = result
+            self._remember(job.memory_keys.get(custom_id), result)
+        if logger:
+            logger(f"Bulk classification returned {len(results)} suggestion(s).")
+        return results
+
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
+    def _log_missing_client(self, logger: Optional[Callable[[str], None]]) -> None:
+        """Explain that the heuristic fallback is used and how to enable ChatGPT."""
+
+        if not logger:
+            return
+        logger("OpenAI client is not configured; using heuristic fallback classifier.")
+        if not self._warned_missing_client:
+            logger(
+                "Set the OPENAI_API_KEY environment variable before launching the app to "
+                "enable ChatGPT-backed categorisation."
+            )
+            logger("Example (PowerShell): setx OPENAI_API_KEY 'sk-...' and restart the app.")
+            logger(
+                "Example (macOS/Linux): export OPENAI_API_KEY='sk-...' before running the app."
+            )
+            self._warned_missing_client = True
+
+    def _new_async_client(self) -> object | None:
+        """Return a fresh AsyncOpenAI client, or ``None`` when it is unavailable.
+
+        Async clients are not cached: their connection pool is bound to the
+        event loop that first uses it.
+        """
+
+        client_cls = getattr(_openai_module, "AsyncOpenAI", None)
+        if client_cls is None or self._client is None:
+            return None
+        api_key = os.getenv("OPENAI_API_KEY")
+        try:
+            return client_cls(api_key=api_key) if api_key else client_cls()
+        except Exception:
+            return None
+
+    def _completion_request(
+        self, prompt: str, response_format: Optional[dict] = None
+    ) -> dict[str, object]:
+        """Build the keyword arguments for a chat completion request."""
+
+        request: dict[str, object] = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+        }
+        if response_format and self.structured_outputs:
+            request["response_format"] = response_format
+        return request
+
+    def _create_completion(
+        self,
+        prompt: str,
+        response_format: Optional[dict] = None,
+        *,
+        logger: Optional[Callable[[str], None]] = None,
+    ) -> object:
+        """Send a single chat completion request using whichever SDK is configured."""
+
+        if self._legacy_client is not None:
+            if logger and not self._warned_legacy_mode:
+                logger("Detected legacy OpenAI SDK; using ChatCompletion API for compatibility.")
+                self._warned_legacy_mode = True
+            # The legacy API predates structured outputs; rely on the prompt instead.
+            return self._legacy_client.create(**self._completion_request(prompt))
+        return self._client.chat.completions.create(  # type: ignore[union-attr]
+            **self._completion_request(prompt, response_format)
+        )
+
+    def _recall_memoised(
+        self,
+        transactions: Sequence[Transaction],
+        results: List[Optional[ClassificationResult]],
+        *,
+        logger: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[List[str], List[int]]:
+        """Fill ``results`` from memory and return the keys plus uncached indices."""
+
+        keys = [self._normalise_transaction(txn) for txn in transactions]
+        pending: List[int] = []
+        with self._state_lock:
+            for index, key in enumerate(keys):
+                if key and key in self._memory:
+                    results[index] = self._memory[key]
+                else:
+                    pending.append(index)
+        if logger and len(pending) < len(transactions):
+            logger(
+                f"Using memoised classifications for {len(transactions) - len(pending)} "
+                "recurring transaction(s)."
+            )
+        return keys, pending
+
+    def _parse_batch_content(
+        self,
+        response: object,
+        count: int,
+        *,
+        logger: Optional[Callable[[str], None]] = None,
+    ) -> dict[int, ClassificationResult]:
+        content = self._extract_message_content(response)
+        if not content:
+            if logger:
+                logger("Model response did not contain any content.")
+            return {}
+        return self._parse_batch_response(content, count)
+
+    def _store_batch_results(
+        self,
+        chunk: Sequence[int],
+        parsed: dict[int, ClassificationResult],
+        transactions: Sequence[Transaction],
+        keys: Sequence[str],
+        categories: Sequence[str],
+        examples: Sequence[Tuple[Transaction, str]],
+        results: List[Optional[ClassificationResult]],
+        *,
+        logger: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Memoise parsed batch results, falling back to heuristics for gaps."""
+
+        for position, index in enumerate(chunk):
+            result = parsed.get(position)
+            if result is None:
+                result = self._heuristic_classification(
+                    transactions[index],
+                    categories,
+                    examples,
+                    normalised_key=keys[index],
+                    logger=logger,
+                )
+            else:
+                self._remember(keys[index], result)
+            results[index] = result
+
     @staticmethod
     def _extract_message_content(response: object) -> str:
         """Extract the assistant message content from an OpenAI response."""
@@ -266,10 +1126,67 @@ class TransactionClassifier:
     def _update_memory(self, examples: Sequence[Tuple[Transaction, str]]) -> None:
         """Seed the classifier memory with known user-labelled transactions."""
 
-        for txn, category_name in examples[-self.max_feedback_examples :]:
-            key = self._normalise_transaction(txn)
-            if key and category_name:
-                self._memory[key] = ClassificationResult(category_name, 0.99)
+        memory = self._memory
+        with self._state_lock:
+            for txn, category_name in examples[-self.max_feedback_examples :]:
+                key = self._normalise_transaction(txn)
+                if not key or not category_name:
+                    continue
+                # The same window is replayed on every call; keep the stored result
+                # instead of allocating an identical one each time.
+                current = memory.get(key)
+                if (
+                    current is not None
+                    and current.category_name == category_name
+                    and current.confidence == 0.99
+                ):
+                    memory.move_to_end(key)
+                else:
+                    memory[key] = ClassificationResult(category_name, 0.99)
+            self._index_examples(examples)
+
+    def _recall(self, key: str | None) -> Optional[ClassificationResult]:
+        """Return the memoised result for ``key``, if any."""
+
+        if not key:
+            return None
+        with self._state_lock:
+            return self._memory[key] if key in self._memory else None
+
+    def _remember(self, key: str | None, result: ClassificationResult) -> None:
+        """Memoise ``result`` under ``key`` when the transaction has a key."""
+
+        if not key:
+            return
+        with self._state_lock:
+            self._memory[key] = result
+
+    def _index_examples(self, examples: Sequence[Tuple[Transaction, str]]) -> None:
+        """Rebuild the example token index when the few-shot window changes.
+
+        Callers must hold ``_state_lock``.
+        """
+
+        window = list(examples[-self.max_feedback_examples :])
+        signature = [(id(txn), category_name) for txn, category_name in window]
+        if signature == self._example_signature:
+            return
+        # The previous window still references its transactions, so their ids are
+        # stable and token sets can be carried over when the window slides.
+        previous_tokens = self._example_tokens
+        example_tokens: dict[int, frozenset[str]] = {}
+        index: dict[str, List[int]] = {}
+        for position, (txn, _category_name) in enumerate(window):
+            tokens = previous_tokens.get(id(txn))
+            if tokens is None:
+                tokens = self._tokenise_transaction(txn)
+            example_tokens[id(txn)] = tokens
+            for token in tokens:
+                index.setdefault(token, []).append(position)
+        self._example_window = window
+        self._example_signature = signature
+        self._example_index = index
+        self._example_tokens = example_tokens
 
     def _heuristic_classification(
         self,
@@ -284,16 +1201,14 @@ class TransactionClassifier:
 
         result = self._match_from_examples(transaction, examples)
         if result:
-            if normalised_key:
-                self._memory[normalised_key] = result
+            self._remember(normalised_key, result)
             if logger:
                 logger("Reused label from prior similar transaction.")
             return result
 
         result = self._match_from_keywords(transaction, existing_categories)
         if result:
-            if normalised_key:
-                self._memory[normalised_key] = result
+            self._remember(normalised_key, result)
             if logger:
                 logger("Derived category from keyword heuristics.")
             return result
@@ -314,169 +1229,166 @@ class TransactionClassifier:
         if not transaction_tokens:
             return None
 
-        for example_txn, category_name in reversed(examples[-self.max_feedback_examples :]):
-            example_tokens = self._tokenise_transaction(example_txn)
-            if not example_tokens:
-                continue
-            if transaction_tokens & example_tokens:
-                confidence = 0.85 if transaction.description == example_txn.description else 0.7
-                return ClassificationResult(category_name, confidence)
-        return None
+        with self._state_lock:
+            self._index_examples(examples)
+            # Positions are appended in order, so the last entry is the most recent example.
+            example_index = self._example_index
+            latest = -1
+            for token in transaction_tokens:
+                positions = example_index.get(token)
+                if positions is not None and positions[-1] > latest:
+                    latest = positions[-1]
+            if latest < 0:
+                return None
+            example_txn, category_name = self._example_window[latest]
+        confidence = 0.85 if transaction.description == example_txn.description else 0.7
+        return ClassificationResult(category_name, confidence)
 
     def _match_from_keywords(
         self, transaction: Transaction, existing_categories: Sequence[str]
     ) -> Optional[ClassificationResult]:
         """Apply keyword heuristics derived from publicly available data."""
 
-        keyword_map: dict[str, str] = {
-            "grocery": "Groceries",
-            "supermarket": "Groceries",
-            "aldi": "Groceries",
-            "lidl": "Groceries",
-            "tesco": "Groceries",
-            "rent": "Rent",
-            "mortgage": "Housing",
-            "uber": "Transport",
-            "lyft": "Transport",
-            "taxi": "Transport",
-            "fuel": "Auto & Transport",
-            "petrol": "Auto & Transport",
-            "shell": "Auto & Transport",
-            "bp": "Auto & Transport",
-            "starbucks": "Dining",
-            "coffee": "Dining",
-            "restaurant": "Dining",
-            "dining": "Dining",
-            "salary": "Income",
-            "payroll": "Income",
-            "bonus": "Income",
-            "electric": "Utilities",
-            "internet": "Utilities",
-            "broadband": "Utilities",
-            "water": "Utilities",
-            "insurance": "Insurance",
-            "pharmacy": "Healthcare",
-            "chemist": "Healthcare",
-            "gym": "Health & Fitness",
-            "fitness": "Health & Fitness",
-        }
-
-        resolved_keywords = {key: self._resolve_category_name(value, existing_categories) for key, value in keyword_map.items()}
-
-        text = " ".join(
-            part
-            for part in [
-                transaction.description,
-                transaction.counterparty,
-                transaction.reference,
-            ]
-            if part
-        ).lower()
-        if not text:
+        description = transaction.description or ""
+        counterparty = transaction.counterparty or ""
+        reference = transaction.reference or ""
+        if not (description or counterparty or reference):
             return None
+        text = _keyword_haystack(description, counterparty, reference)
 
-        for keyword, category_name in resolved_keywords.items():
-            if keyword in text:
-                return ClassificationResult(category_name, 0.6)
-        return None
-
-    def _resolve_category_name(
-        self, suggestion: str, existing_categories: Sequence[str]
-    ) -> str:
-        """Adjust a heuristic suggestion to match an existing category name."""
-
-        suggestion_lower = suggestion.lower()
-        for name in existing_categories:
-            if name.lower() == suggestion_lower:
-                return name
-        for name in existing_categories:
-            lowered = name.lower()
-            if suggestion_lower in lowered or lowered in suggestion_lower:
-                return name
-        return suggestion
+        best_position = -1
+        automaton = _keyword_automaton()
+        if automaton is not None:
+            # Single pass over the text; keep the earliest map entry that occurs.
+            for _end, position in automaton.iter(text):
+                if best_position < 0 or position < best_position:
+                    best_position = position
+        else:
+            for position, keyword in enumerate(_KEYWORDS):
+                if keyword in text:
+                    best_position = position
+                    break
+        if best_position < 0:
+            return None
+        # Only the winning category needs resolving against the user's names.
+        category_name = _KEYWORD_CATEGORIES[_KEYWORD_CATEGORY_INDEX[best_position]]
+        return ClassificationResult(
+            _resolve_category_name(category_name, tuple(existing_categories)), 0.6
+        )
 
     @staticmethod
-    def _tokenise_transaction(transaction: Transaction) -> set[str]:
+    def _tokenise_transaction(transaction: Transaction) -> frozenset[str]:
         """Create a set of lowercase keywords representing a transaction."""
 
-        text = " ".join(
-            part
-            for part in [
-                transaction.description,
-                transaction.counterparty,
-                transaction.account_name,
-                transaction.reference,
-            ]
-            if part
-        ).lower()
-        if not text:
-            return set()
-        tokens = re.split(r"[^a-z0-9]+", text)
-        return {token for token in tokens if token}
+        return _tokenise_fields(
+            transaction.description,
+            transaction.counterparty,
+            transaction.account_name,
+            transaction.reference,
+        )
+
+    def _build_prompt_context(
+        self,
+        existing_categories: List[str],
+        examples: Sequence[Tuple[Transaction, str]],
+    ) -> str:
+        """Describe the known categories and few-shot examples for a prompt."""
+
+        category_names = tuple(sorted({name for name in existing_categories if name}))
+        example_rows = tuple(
+            (_transaction_fields(txn), category_name)
+            for txn, category_name in examples[-self.max_feedback_examples :]
+        )
+        return _build_prompt_header(category_names, example_rows)
 
     def _build_prompt(
         self,
         transaction: Transaction,
         existing_categories: List[str],
         examples: Sequence[Tuple[Transaction, str]],
+        *,
+        header: Optional[str] = None,
     ) -> str:
         """Create a prompt that guides ChatGPT to classify the transaction."""
 
-        category_section = (
-            ", ".join(sorted({name for name in existing_categories if name}))
-            if existing_categories
-            else "(no existing categories)"
-        )
+        if header is None:
+            header = self._build_prompt_context(existing_categories, examples)
+        out = [
+            header,
+            "Classify the following transaction. If no category fits, suggest a concise new one.\n"
+            "Transaction: ",
+            _describe_transaction(transaction),
+            "\n\nRespond with strictly valid JSON: "
+            "{\"category\": \"<name>\", \"confidence\": <number between 0 and 1>}",
+        ]
+        return "".join(out)
 
-        example_lines = []
-        for txn, category_name in examples[-self.max_feedback_examples :]:
-            parts = [
-                f"Description: {txn.description or '-'}",
-                f"Amount: {txn.amount}",
-            ]
-            if txn.counterparty:
-                parts.append(f"Counterparty: {txn.counterparty}")
-            if txn.account_name or txn.account_id:
-                account = txn.account_name or txn.account_id
-                parts.append(f"Account: {account}")
-            if txn.reference:
-                parts.append(f"Reference: {txn.reference}")
-            parts.append(f"Category: {category_name}")
-            example_lines.append("; ".join(parts))
-
-        examples_section = "\n".join(example_lines) if example_lines else "(no prior examples)"
-
-        txn_parts = [
-            f"Description: {transaction.description or '-'}",
-            f"Amount: {transaction.amount}",
+    def _build_batch_prompt(
+        self,
+        transactions: Sequence[Transaction],
+        existing_categories: List[str],
+        examples: Sequence[Tuple[Transaction, str]],
+        *,
+        header: Optional[str] = None,
+    ) -> str:
+        """Create a prompt that asks ChatGPT to classify several transactions at once."""
+
+        if header is None:
+            header = self._build_prompt_context(existing_categories, examples)
+        out = [
+            header,
+            "Classify each of the following transactions. If no category fits, suggest a "
+            "concise new one.",
         ]
-        if transaction.counterparty:
-            txn_parts.append(f"Counterparty: {transaction.counterparty}")
-        if transaction.account_name or transaction.account_id:
-            account = transaction.account_name or transaction.account_id
-            txn_parts.append(f"Account: {account}")
-        if transaction.reference:
-            txn_parts.append(f"Reference: {transaction.reference}")
-        txn_parts.append(f"Occurred On: {transaction.occurred_on}")
-        transaction_section = "; ".join(txn_parts)
-
-        return (
-            "The budgeting app currently has the following categories: "
-            f"{category_section}.\n"
-            "Here are previously labelled transactions (use them as few-shot learning examples):\n"
-            f"{examples_section}\n\n"
-            "Classify the following transaction. If no category fits, suggest a concise new one.\n"
-            f"Transaction: {transaction_section}\n\n"
-            "Respond with strictly valid JSON: {\"category\": \"<name>\", \"confidence\": <number between 0 and 1>}"
+        for index, transaction in enumerate(transactions):
+            out.append(f"\n[{index}] {_describe_transaction(transaction)}")
+        out.append(
+            "\n\nRespond with strictly valid JSON containing one result per transaction: "
+            "{\"results\": [{\"index\": <number in brackets>, \"category\": \"<name>\", "
+            "\"confidence\": <number between 0 and 1>}]}"
         )
+        return "".join(out)
 
     @staticmethod
     def _parse_response(message: str) -> Optional[ClassificationResult]:
         """Parse the JSON payload returned by ChatGPT."""
 
-        payload = TransactionClassifier._extract_json_object(message)
-        if not payload:
+        payload = TransactionClassifier._extract_json(message)
+        if isinstance(payload, list) and len(payload) == 1:
+            # Unstructured replies sometimes wrap the single object in an array.
+            payload = payload[0]
+        if not isinstance(payload, dict):
             return None
+        return TransactionClassifier._result_from_payload(payload)
+
+    @staticmethod
+    def _parse_batch_response(message: str, count: int) -> dict[int, ClassificationResult]:
+        """Parse a JSON array of indexed classifications returned by ChatGPT."""
+
+        payload = TransactionClassifier._extract_json(message)
+        if isinstance(payload, dict):
+            payload = payload.get("results", [payload])
+        if not isinstance(payload, list):
+            return {}
+
+        results: dict[int, ClassificationResult] = {}
+        for entry in payload:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("index"))
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < count or index in results:
+                continue
+            result = TransactionClassifier._result_from_payload(entry)
+            if result:
+                results[index] = result
+        return results
+
+    @staticmethod
+    def _result_from_payload(payload: dict) -> Optional[ClassificationResult]:
+        """Build a classification result from a decoded JSON object."""
 
         category = str(payload.get("category", "")).strip()
         if not category:
@@ -490,29 +1402,36 @@ class TransactionClassifier:
         return ClassificationResult(category_name=category, confidence=confidence)
 
     @staticmethod
-    def _extract_json_object(message: str) -> Optional[dict]:
-        """Extract the first JSON object embedded in a string."""
+    def _extract_json(message: str) -> Optional[dict | list]:
+        """Extract the first JSON object or array embedded in a string."""
 
-        match = re.search(r"\{.*\}", message, re.DOTALL)
-        if not match:
-            return None
-        candidate = match.group(0)
-        try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
-            return None
+        stripped = message.strip()
+        if stripped[:1] in ("{", "["):
+            # Structured outputs return bare JSON, so try decoding it directly first.
+            try:
+                return _json_loads(stripped)
+            except ValueError:
+                pass
+        start = _next_json_start(message, 0)
+        while start != -1:
+            end = _json_span_end(message, start)
+            if end is None:
+                # An unbalanced bracket in prose; resume at the next opening one.
+                start = _next_json_start(message, start + 1)
+                continue
+            try:
+                return _json_loads(message[start:end])
+            except ValueError:
+                start = _next_json_start(message, start + 1)
+        return None
 
     @staticmethod
     def _normalise_transaction(transaction: Transaction) -> str:
         """Create a stable key for matching recurring transactions."""
 
-        parts = [
+        return _normalise_fields(
             transaction.description,
             transaction.counterparty,
             transaction.account_name or transaction.account_id,
             transaction.reference,
-        ]
-        text = " ".join(part for part in parts if part)
-        normalised = re.sub(r"\s+", " ", text.strip().lower())
-        return normalised
-
+        )
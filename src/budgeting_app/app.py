@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import queue
 import threading
 import tkinter as tk
 import urllib.parse
 import webbrowser
+from concurrent.futures import Future
 from pathlib import Path
 from tkinter import filedialog, messagebox, scrolledtext, ttk
+from tkinter import font as tkfont
 
 from .ai import ClassificationResult
+from .csv_importer import CSVTransaction
+from .models import Transaction
 from .viewmodels import BudgetViewModel
 from .widgets import CurrencyEntry, LabeledEntry, Table
 
+BULK_POLL_INTERVAL_MS = 60_000
+AI_EVENT_DRAIN_MS = 50
+AI_EVENTS_PER_DRAIN = 200
+AI_REFRESH_DEBOUNCE_MS = 200
+DATA_REFRESH_DEBOUNCE_MS = 50
+
 
 class BudgetApp(tk.Tk):
     """Main application window."""
@@ -28,11 +40,35 @@ class BudgetApp(tk.Tk):
         self.status_var = tk.StringVar(value="Ready")
         self.ai_active = False
         self.ai_suggestions: dict[str, ClassificationResult] = {}
+        self._applied_ai_suggestions: dict[str, ClassificationResult] = {}
+        self._displayed_ai_suggestions: dict[str, str] = {}
+        self._transactions_by_id: dict[str, Transaction] = {}
         self.ai_log_visible = False
-        self._ai_worker_thread: threading.Thread | None = None
-        self._ai_stop_event: threading.Event | None = None
+        self._ai_loop: asyncio.AbstractEventLoop | None = None
+        self._ai_future: Future | None = None
+        # Set when the running worker is stopped; its queued updates are dropped.
+        self._ai_cancelled: threading.Event | None = None
+        # Worker -> UI updates tagged with their run's cancel event, applied in
+        # batches by _drain_ai_events.
+        self._ai_events: queue.SimpleQueue[
+            tuple[threading.Event, tuple[str, ClassificationResult] | None]
+        ] = queue.SimpleQueue()
+        self._ai_drain_id: str | None = None
+        self._ai_refresh_after_id: str | None = None
         self._ai_refresh_pending = False
-        self._suspend_ai_refresh = False
+        self._rendered_categories: list[dict[str, str]] | None = None
+        self._rendered_transactions: list[dict[str, str]] | None = None
+        self._category_named_ids: tuple[tuple[str, str], ...] | None = None
+        self._totals_text: tuple[str, str, str] | None = None
+        self._data_refresh_after_id: str | None = None
+        self._import_in_progress = False
+        self._save_in_progress = False
+        self._bulk_submit_in_progress = False
+        # The Edit Category dialog is built on first use and hidden, not destroyed.
+        self._edit_category_dialog: tk.Toplevel | None = None
+        self._edit_name_input: LabeledEntry | None = None
+        self._edit_amount_input: CurrencyEntry | None = None
+        self._editing_category_id: str | None = None
 
         self._configure_styles()
         self._build_menu()
@@ -40,16 +76,23 @@ class BudgetApp(tk.Tk):
 
         self.viewmodel.add_listener(self._on_data_changed)
         self.viewmodel.load()
+        self._set_status("Budget data loaded.")
 
     # ------------------------------------------------------------------ #
     # Layout helpers
     # ------------------------------------------------------------------ #
     def _configure_styles(self) -> None:
+        # Named fonts are created once and shared by every widget that uses them.
+        self._title_font = tkfont.Font(self, family="Segoe UI", size=12, weight="bold")
+        self._bold_font = tkfont.Font(self, family="Segoe UI", size=10, weight="bold")
+        self._total_font = tkfont.Font(self, family="Consolas", size=12)
+        self._log_font = tkfont.Font(self, family="Consolas", size=10)
+
         style = ttk.Style(self)
         style.theme_use("clam")
         style.configure("Card.TLabelframe", padding=12)
-        style.configure("Card.TLabelframe.Label", font=("Segoe UI", 12, "bold"))
-        style.configure("Primary.TButton", font=("Segoe UI", 10, "bold"))
+        style.configure("Card.TLabelframe.Label", font=self._title_font)
+        style.configure("Primary.TButton", font=self._bold_font)
 
     def _build_layout(self) -> None:
         container = ttk.Frame(self, padding=12)
@@ -81,19 +124,20 @@ class BudgetApp(tk.Tk):
                 ("Remaining:", self.remaining_total_var),
             ]
         ):
-            ttk.Label(totals_frame, text=label, font=("Segoe UI", 10, "bold")).grid(
+            ttk.Label(totals_frame, text=label, font=self._bold_font).grid(
                 row=0, column=2 * idx, sticky="w"
             )
-            ttk.Label(totals_frame, textvariable=var, font=("Consolas", 12)).grid(
+            ttk.Label(totals_frame, textvariable=var, font=self._total_font).grid(
                 row=0, column=2 * idx + 1, sticky="w"
             )
 
-        ttk.Button(
+        self.save_button = ttk.Button(
             totals_frame,
             text="Save Budget",
             command=self._save_budget,
             style="Primary.TButton",
-        ).grid(row=0, column=6, sticky="e")
+        )
+        self.save_button.grid(row=0, column=6, sticky="e")
 
     def _build_categories_section(self, parent: ttk.Frame) -> None:
         categories_frame = ttk.Labelframe(
@@ -181,11 +225,12 @@ class BudgetApp(tk.Tk):
             command=self._handle_add_transaction,
         ).grid(row=1, column=2, sticky="ew", padx=(12, 0), pady=(6, 0))
 
-        ttk.Button(
+        self.import_button = ttk.Button(
             form,
             text="Import CSV...",
             command=self._handle_import_csv,
-        ).grid(row=1, column=3, sticky="ew", padx=(12, 0), pady=(6, 0))
+        )
+        self.import_button.grid(row=1, column=3, sticky="ew", padx=(12, 0), pady=(6, 0))
 
         self.transaction_table = Table(
             transactions_frame,
@@ -265,23 +310,11 @@ class BudgetApp(tk.Tk):
         )
         self.ai_log_button.grid(row=3, column=0, columnspan=3, sticky="ew", pady=(6, 0))
 
-        self.ai_log_frame = ttk.Labelframe(
-            transactions_frame,
-            text="AI Classification Log",
-            style="Card.TLabelframe",
-        )
-        self.ai_log_frame.grid(row=4, column=0, sticky="nsew", pady=(6, 0))
-        self.ai_log_frame.columnconfigure(0, weight=1)
-        self.ai_log_text = scrolledtext.ScrolledText(
-            self.ai_log_frame,
-            height=10,
-            wrap="word",
-            state="disabled",
-            font=("Consolas", 10),
-        )
-        self.ai_log_text.grid(row=0, column=0, sticky="nsew")
-        self.ai_log_frame.rowconfigure(0, weight=1)
-        self.ai_log_frame.grid_remove()
+        # The AI log is built the first time it is shown; see _ensure_ai_log_built.
+        self._transactions_frame = transactions_frame
+        self.ai_log_frame: ttk.Labelframe | None = None
+        self.ai_log_text: scrolledtext.ScrolledText | None = None
+        self._ai_log_rendered = (0, 0)  # (offset, entry count) shown in ai_log_text
 
         ttk.Button(
             transactions_frame,
@@ -403,14 +436,18 @@ class BudgetApp(tk.Tk):
         self.ai_active = False
         self.ai_start_button.configure(state="normal")
         self.ai_stop_button.configure(state="disabled")
-        if self._ai_stop_event:
-            self._ai_stop_event.set()
-        if self._ai_worker_thread and self._ai_worker_thread.is_alive():
-            self._ai_worker_thread.join(timeout=1.0)
-        self._ai_worker_thread = None
-        self._ai_stop_event = None
+        if self._ai_future:
+            # Cancelling the task abandons any in-flight request without blocking.
+            self._ai_future.cancel()
+        if self._ai_cancelled is not None:
+            self._ai_cancelled.set()
+        self._ai_future = None
+        self._ai_cancelled = None
         self._ai_refresh_pending = False
-        self._on_data_changed(self.viewmodel.ledger)
+        if self._ai_refresh_after_id is not None:
+            self.after_cancel(self._ai_refresh_after_id)
+            self._ai_refresh_after_id = None
+        self._on_ai_suggestions_changed()
         self.viewmodel.add_ai_log_entry("AI classification stopped by user.")
         self._refresh_ai_log()
         self._set_status("AI classification stopped.")
@@ -454,6 +491,8 @@ class BudgetApp(tk.Tk):
         self.ai_suggestions.pop(transaction_id, None)
 
     def _handle_import_csv(self) -> None:
+        if self._import_in_progress:
+            return
         file_path = filedialog.askopenfilename(
             title="Select CSV File",
             filetypes=(("CSV files", "*.csv"), ("All files", "*.*")),
@@ -461,8 +500,33 @@ class BudgetApp(tk.Tk):
         if not file_path:
             self._set_status("Import cancelled.")
             return
+        self._import_in_progress = True
+        self.import_button.configure(state="disabled")
+        self._set_status(f"Importing {Path(file_path).name}...")
+
+        def worker() -> None:
+            # Only parse off the UI thread; the ledger is updated in _on_csv_parsed.
+            try:
+                records = self.viewmodel.read_csv_transactions(file_path)
+            except Exception as exc:  # noqa: BLE001
+                self.after(0, lambda exc=exc: self._on_csv_parsed(file_path, None, exc))
+                return
+            self.after(0, lambda: self._on_csv_parsed(file_path, records, None))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_csv_parsed(
+        self,
+        file_path: str,
+        records: list[CSVTransaction] | None,
+        error: Exception | None,
+    ) -> None:
+        self._import_in_progress = False
+        self.import_button.configure(state="normal")
         try:
-            imported = self.viewmodel.import_transactions_from_csv(file_path)
+            if error is not None:
+                raise error
+            imported = self.viewmodel.import_csv_transactions(records or [])
         except Exception as exc:  # noqa: BLE001
             messagebox.showerror("Import Failed", str(exc))
             self._set_status("Import failed.")
@@ -479,85 +543,214 @@ class BudgetApp(tk.Tk):
             self._set_status(f"Imported {imported} transactions from {short_name}.")
 
     def _save_budget(self) -> None:
-        self.viewmodel.save()
+        if self._save_in_progress:
+            return
+        # Serialise on the UI thread so the worker never sees a half-edited ledger.
+        payload = self.viewmodel.snapshot()
+        self._save_in_progress = True
+        self.save_button.configure(state="disabled")
+        self._set_status("Saving budget...")
+
+        def worker() -> None:
+            error: Exception | None = None
+            try:
+                self.viewmodel.write_snapshot(payload)
+            except Exception as exc:  # noqa: BLE001
+                error = exc
+            try:
+                self.after(0, lambda: self._on_budget_saved(error))
+            except (RuntimeError, tk.TclError):
+                pass  # The window closed while the file was being written.
+
+        # Not a daemon: closing the window mid-save must not kill the write.
+        threading.Thread(target=worker).start()
+
+    def _on_budget_saved(self, error: Exception | None) -> None:
+        self._save_in_progress = False
+        self.save_button.configure(state="normal")
+        if error is not None:
+            messagebox.showerror("Save Failed", str(error))
+            self._set_status("Save failed.")
+            return
         messagebox.showinfo("Budget Saved", "Budget data saved successfully.")
         self._set_status("Budget saved.")
 
+    def _handle_bulk_classification(self) -> None:
+        # The job only counts as pending once the upload returns, so also guard
+        # the submission itself against a second click.
+        if self._bulk_submit_in_progress or self.viewmodel.bulk_classification_pending:
+            messagebox.showinfo(
+                "Bulk Categorisation", "A bulk categorisation job is already pending."
+            )
+            return
+        self._bulk_submit_in_progress = True
+        self._set_status("Submitting bulk AI categorisation...")
+
+        def worker() -> None:
+            try:
+                submitted = self.viewmodel.submit_bulk_classification()
+            except Exception as exc:  # noqa: BLE001 - surface unexpected failures
+                self.viewmodel.add_ai_log_entry(f"Bulk AI categorisation error: {exc}")
+                submitted = False
+            self.after(0, lambda: self._on_bulk_classification_submitted(submitted))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_bulk_classification_submitted(self, submitted: bool) -> None:
+        self._bulk_submit_in_progress = False
+        self._refresh_ai_log()
+        if not submitted:
+            self._set_status("Bulk AI categorisation was not submitted; see the AI log.")
+            return
+        self._set_status("Bulk AI categorisation pending.")
+        self.after(BULK_POLL_INTERVAL_MS, self._poll_bulk_classification)
+
+    def _poll_bulk_classification(self) -> None:
+        def worker() -> None:
+            try:
+                count = self.viewmodel.poll_bulk_classification()
+            except Exception as exc:  # noqa: BLE001 - surface unexpected failures
+                self.after(0, lambda exc=exc: self._on_bulk_classification_failed(exc))
+                return
+            self.after(0, lambda: self._on_bulk_classification_polled(count))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_bulk_classification_failed(self, error: Exception) -> None:
+        # Drop the job so a new bulk run can be queued instead of waiting forever.
+        self.viewmodel.cancel_bulk_classification()
+        self.viewmodel.add_ai_log_entry(f"Bulk AI categorisation error: {error}")
+        self._refresh_ai_log()
+        self._set_status("Bulk AI categorisation failed; see the AI log.")
+
+    def _on_bulk_classification_polled(self, count: int | None) -> None:
+        self._refresh_ai_log()
+        if count is None:
+            self.after(BULK_POLL_INTERVAL_MS, self._poll_bulk_classification)
+            return
+        self._set_status(
+            f"Bulk AI categorisation finished with {count} suggestions; "
+            "start AI categorisation to review them."
+        )
+
     # ------------------------------------------------------------------ #
     # Data binding
     # ------------------------------------------------------------------ #
     def _on_data_changed(self, _ledger) -> None:
+        # Trailing-edge debounce: a burst of ledger changes is rendered once.
+        if self._data_refresh_after_id is not None:
+            self.after_cancel(self._data_refresh_after_id)
+        self._data_refresh_after_id = self.after(
+            DATA_REFRESH_DEBOUNCE_MS, self._refresh_from_ledger
+        )
+
+    def _refresh_from_ledger(self) -> None:
+        self._data_refresh_after_id = None
+        ledger = self.viewmodel.ledger
         categories = list(self.viewmodel.categories_for_table())
         transactions = list(self.viewmodel.transactions_for_table())
+        self._transactions_by_id = {txn.transaction_id: txn for txn in ledger.transactions}
 
         self._prune_ai_suggestions()
 
-        if self.ai_active and not self._suspend_ai_refresh:
+        if self.ai_active:
             self._request_ai_refresh()
-        self._suspend_ai_refresh = False
-
-        self.category_table.populate(categories, key_field="category_id")
-        self.transaction_table.populate(transactions, key_field="transaction_id")
-        self._apply_ai_suggestions_to_table()
 
-        planned_total = sum(float(row["planned"]) for row in categories)
-        actual_total = sum(float(row["actual"]) for row in categories)
-        self.planned_total_var.set(f"{planned_total:.2f}")
-        self.actual_total_var.set(f"{actual_total:.2f}")
-        self.remaining_total_var.set(f"{(planned_total - actual_total):.2f}")
-
-        self.category_lookup = {row["name"]: row["category_id"] for row in categories}
-        self.category_name_by_id = {row["category_id"]: row["name"] for row in categories}
-        self.txn_category_input.configure(values=list(self.category_lookup.keys()))
-        self.assign_category_input.configure(values=list(self.category_lookup.keys()))
-        self._set_status("Budget data loaded.")
+        # Most changes touch only one of the two tables; leave the other one alone.
+        transactions_changed = transactions != self._rendered_transactions
+        if transactions_changed:
+            rewritten = self.transaction_table.populate(
+                transactions, key_field="transaction_id"
+            )
+            # Rewritten rows come back with empty suggestion cells.
+            for item_id in rewritten:
+                self._displayed_ai_suggestions.pop(item_id, None)
+            self._rendered_transactions = transactions
+        if transactions_changed or self.ai_suggestions != self._applied_ai_suggestions:
+            self._apply_ai_suggestions_to_table()
+
+        if categories != self._rendered_categories:
+            self.category_table.populate(categories, key_field="category_id")
+            self._rendered_categories = categories
+
+            planned_total, actual_total = self.viewmodel.totals()
+            totals_text = (
+                f"{planned_total:.2f}",
+                f"{actual_total:.2f}",
+                f"{(planned_total - actual_total):.2f}",
+            )
+            if totals_text != self._totals_text:
+                self._totals_text = totals_text
+                self.planned_total_var.set(totals_text[0])
+                self.actual_total_var.set(totals_text[1])
+                self.remaining_total_var.set(totals_text[2])
+
+            # Amount changes are far more common than renames; only rebuild the
+            # lookups and combobox values when the set of names changed.
+            named_ids = tuple((row["category_id"], row["name"]) for row in categories)
+            if named_ids != self._category_named_ids:
+                self._category_named_ids = named_ids
+                self.category_name_by_id = dict(named_ids)
+                self.category_lookup = {name: category_id for category_id, name in named_ids}
+                names = tuple(self.category_lookup)
+                self.txn_category_input.configure(values=names)
+                self.assign_category_input.configure(values=names)
         self._refresh_ai_log()
         self._update_transaction_actions_state()
 
+    def _on_ai_suggestions_changed(self) -> None:
+        """Re-render the suggestion column without rebuilding the tables."""
+
+        self._prune_ai_suggestions()
+        self._apply_ai_suggestions_to_table()
+
     def _apply_ai_suggestions_to_table(self) -> None:
         """Populate the AI suggestion column for the rendered transactions."""
 
-        if not hasattr(self, "transaction_table"):
-            return
-
-        tree = self.transaction_table.tree
-        columns = set(tree["columns"])
-        if "suggestion" not in columns or "apply" not in columns:
+        suggestions = self.ai_suggestions
+        if not suggestions and not self._displayed_ai_suggestions:
+            # Nothing shown and nothing to show: the common case with AI off.
+            self._applied_ai_suggestions = {}
             return
-
-        for item_id in tree.get_children(""):
-            self._update_ai_row(item_id, self.ai_suggestions.get(item_id))
+        update_row = self._update_ai_row
+        # Only rows that show or should show a suggestion need touching.
+        for item_id in self._displayed_ai_suggestions.keys() - suggestions.keys():
+            update_row(item_id, None)
+        for item_id, suggestion in suggestions.items():
+            update_row(item_id, suggestion)
+        self._applied_ai_suggestions = dict(suggestions)
 
     def _prune_ai_suggestions(self) -> None:
         if not self.ai_suggestions:
             return
-        valid_unassigned = {
-            txn.transaction_id
-            for txn in self.viewmodel.ledger.transactions
-            if txn.transaction_id and not txn.category_id
+        transactions_by_id = self._transactions_by_id
+        self.ai_suggestions = {
+            transaction_id: suggestion
+            for transaction_id, suggestion in self.ai_suggestions.items()
+            if (txn := transactions_by_id.get(transaction_id)) is not None
+            and not txn.category_id
         }
-        stale_ids = [
-            transaction_id
-            for transaction_id in list(self.ai_suggestions)
-            if transaction_id not in valid_unassigned
-        ]
-        for transaction_id in stale_ids:
-            self.ai_suggestions.pop(transaction_id, None)
 
     def _update_ai_row(
         self, transaction_id: str, suggestion: ClassificationResult | None
     ) -> None:
-        if not hasattr(self, "transaction_table"):
+        displayed = self._displayed_ai_suggestions
+        text = self._format_ai_suggestion(suggestion) if suggestion else ""
+        if displayed.get(transaction_id, "") == text:
             return
-        tree = self.transaction_table.tree
-        if not tree.exists(transaction_id):
+        # Rows almost always exist; let the table report a missing one instead of
+        # probing with tree.exists() first.
+        try:
+            self.transaction_table.set_cells(
+                transaction_id, {"suggestion": text, "apply": "✅" if text else ""}
+            )
+        except (KeyError, tk.TclError):
+            displayed.pop(transaction_id, None)
             return
-        if suggestion:
-            tree.set(transaction_id, "suggestion", self._format_ai_suggestion(suggestion))
-            tree.set(transaction_id, "apply", "✅")
+        if text:
+            displayed[transaction_id] = text
         else:
-            tree.set(transaction_id, "suggestion", "")
-            tree.set(transaction_id, "apply", "")
+            displayed.pop(transaction_id, None)
 
     @staticmethod
     def _format_ai_suggestion(suggestion: ClassificationResult) -> str:
@@ -576,10 +769,8 @@ class BudgetApp(tk.Tk):
         self._update_ai_row(transaction_id, suggestion)
 
     def _transaction_is_unassigned(self, transaction_id: str) -> bool:
-        for txn in self.viewmodel.ledger.transactions:
-            if txn.transaction_id == transaction_id:
-                return not txn.category_id
-        return False
+        txn = self._transactions_by_id.get(transaction_id)
+        return txn is not None and not txn.category_id
 
     def _handle_category_selection(self, _event) -> None:
         selected = self.category_table.tree.selection()
@@ -623,84 +814,105 @@ class BudgetApp(tk.Tk):
             )
             return
 
+        dialog = self._ensure_edit_category_dialog()
+        self._editing_category_id = category_id
+        self._edit_name_input.set(category.name)
+        self._edit_amount_input.set(f"{category.planned_amount:.2f}")
+        dialog.deiconify()
+        dialog.grab_set()
+        self._edit_name_input.focus_set()
+
+    def _ensure_edit_category_dialog(self) -> tk.Toplevel:
+        """Build the Edit Category dialog on first use; later edits reuse it."""
+
+        if self._edit_category_dialog is not None:
+            return self._edit_category_dialog
+
         dialog = tk.Toplevel(self)
+        dialog.withdraw()
         dialog.title("Edit Category")
         dialog.transient(self)
-        dialog.grab_set()
         dialog.resizable(False, False)
+        dialog.protocol("WM_DELETE_WINDOW", self._close_edit_category_dialog)
 
         container = ttk.Frame(dialog, padding=12)
         container.grid(row=0, column=0, sticky="nsew")
         container.columnconfigure(0, weight=1)
 
-        name_input = LabeledEntry(container, label="Name")
-        name_input.grid(row=0, column=0, sticky="ew")
-        name_input.set(category.name)
+        self._edit_name_input = LabeledEntry(container, label="Name")
+        self._edit_name_input.grid(row=0, column=0, sticky="ew")
 
-        amount_input = CurrencyEntry(container, label="Planned Amount")
-        amount_input.grid(row=1, column=0, sticky="ew", pady=(6, 0))
-        amount_input.set(f"{category.planned_amount:.2f}")
+        self._edit_amount_input = CurrencyEntry(container, label="Planned Amount")
+        self._edit_amount_input.grid(row=1, column=0, sticky="ew", pady=(6, 0))
 
         button_frame = ttk.Frame(container)
         button_frame.grid(row=2, column=0, sticky="e", pady=(12, 0))
+        ttk.Button(
+            button_frame, text="Cancel", command=self._close_edit_category_dialog
+        ).grid(row=0, column=0, padx=(0, 6))
+        ttk.Button(
+            button_frame,
+            text="Save",
+            command=self._save_edited_category,
+            style="Primary.TButton",
+        ).grid(row=0, column=1)
 
-        updated_name: str | None = None
-
-        def on_save() -> None:
-            nonlocal updated_name
-            new_name = name_input.get().strip()
-            planned = amount_input.get().strip() or "0"
-            if not new_name:
-                messagebox.showinfo(
-                    "Missing Data", "Please provide a category name.", parent=dialog
-                )
-                return
-            try:
-                self.viewmodel.update_category(
-                    category_id,
-                    name=new_name,
-                    planned_amount=planned,
-                )
-            except ValueError:
-                messagebox.showerror(
-                    "Invalid Amount",
-                    "Planned amount must be numeric.",
-                    parent=dialog,
-                )
-                return
-            except KeyError:
-                messagebox.showerror(
-                    "Category Missing",
-                    "The selected category could not be found.",
-                    parent=dialog,
-                )
-                dialog.destroy()
-                return
-            updated_name = new_name
-            dialog.destroy()
-
-        def on_cancel() -> None:
-            dialog.destroy()
+        dialog.bind("<Return>", lambda _event: self._save_edited_category())
+        dialog.bind("<Escape>", lambda _event: self._close_edit_category_dialog())
+        self._edit_category_dialog = dialog
+        return dialog
 
-        ttk.Button(button_frame, text="Cancel", command=on_cancel).grid(
-            row=0, column=0, padx=(0, 6)
-        )
-        ttk.Button(button_frame, text="Save", command=on_save, style="Primary.TButton").grid(
-            row=0, column=1
-        )
-
-        dialog.bind("<Return>", lambda _event: on_save())
-        dialog.bind("<Escape>", lambda _event: on_cancel())
-        dialog.wait_window()
+    def _save_edited_category(self) -> None:
+        dialog = self._edit_category_dialog
+        category_id = self._editing_category_id
+        if dialog is None or category_id is None:
+            return
+        new_name = self._edit_name_input.get().strip()
+        planned = self._edit_amount_input.get().strip() or "0"
+        if not new_name:
+            messagebox.showinfo(
+                "Missing Data", "Please provide a category name.", parent=dialog
+            )
+            return
+        try:
+            self.viewmodel.update_category(
+                category_id,
+                name=new_name,
+                planned_amount=planned,
+            )
+        except ValueError:
+            messagebox.showerror(
+                "Invalid Amount",
+                "Planned amount must be numeric.",
+                parent=dialog,
+            )
+            return
+        except KeyError:
+            messagebox.showerror(
+                "Category Missing",
+                "The selected category could not be found.",
+                parent=dialog,
+            )
+            self._close_edit_category_dialog()
+            return
+        self._close_edit_category_dialog()
+        self._set_status(f"Updated category '{new_name}'.")
 
-        if updated_name is not None:
-            self._set_status(f"Updated category '{updated_name}'.")
+    def _close_edit_category_dialog(self) -> None:
+        self._editing_category_id = None
+        if self._edit_category_dialog is not None:
+            self._edit_category_dialog.grab_release()
+            self._edit_category_dialog.withdraw()
 
     def _build_menu(self) -> None:
         menu_bar = tk.Menu(self)
         file_menu = tk.Menu(menu_bar, tearoff=0)
         file_menu.add_command(label="Import CSV...", command=self._handle_import_csv)
         file_menu.add_command(label="Save Budget", command=self._save_budget)
+        file_menu.add_command(
+            label="Queue Bulk AI Categorisation",
+            command=self._handle_bulk_classification,
+        )
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.destroy)
         menu_bar.add_cascade(label="File", menu=file_menu)
@@ -720,33 +932,75 @@ class BudgetApp(tk.Tk):
     def _set_status(self, message: str) -> None:
         self.status_var.set(message)
 
+    def _ensure_ai_log_built(self) -> ttk.Labelframe:
+        if self.ai_log_frame is None:
+            self.ai_log_frame = ttk.Labelframe(
+                self._transactions_frame,
+                text="AI Classification Log",
+                style="Card.TLabelframe",
+            )
+            self.ai_log_frame.grid(row=4, column=0, sticky="nsew", pady=(6, 0))
+            self.ai_log_frame.columnconfigure(0, weight=1)
+            self.ai_log_text = scrolledtext.ScrolledText(
+                self.ai_log_frame,
+                height=10,
+                wrap="word",
+                state="disabled",
+                font=self._log_font,
+            )
+            self.ai_log_text.grid(row=0, column=0, sticky="nsew")
+            self.ai_log_frame.rowconfigure(0, weight=1)
+        return self.ai_log_frame
+
     def _toggle_ai_log(self) -> None:
         self.ai_log_visible = not self.ai_log_visible
         if self.ai_log_visible:
-            self.ai_log_frame.grid()
+            self._ensure_ai_log_built().grid()
             self.ai_log_button.configure(text="Hide AI Log")
             self._refresh_ai_log()
-        else:
+        elif self.ai_log_frame is not None:
             self.ai_log_frame.grid_remove()
             self.ai_log_button.configure(text="Show AI Log")
 
     def _refresh_ai_log(self) -> None:
-        if not hasattr(self, "ai_log_text"):
+        # A hidden log is brought up to date when it is next shown.
+        if self.ai_log_text is None or not self.ai_log_visible:
             return
-        entries = self.viewmodel.get_ai_log()
-        self.ai_log_text.configure(state="normal")
-        self.ai_log_text.delete("1.0", tk.END)
-        if entries:
-            self.ai_log_text.insert("1.0", "\n".join(entries) + "\n")
+        offset, entries = self.viewmodel.get_ai_log_window()
+        rendered_offset, rendered_count = self._ai_log_rendered
+        if offset == rendered_offset and len(entries) >= rendered_count:
+            new_entries = entries[rendered_count:]
+            if not new_entries:
+                return
+            self.ai_log_text.configure(state="normal")
+        else:
+            # Entries were trimmed or cleared; redraw from scratch.
+            new_entries = entries
+            self.ai_log_text.configure(state="normal")
+            self.ai_log_text.delete("1.0", tk.END)
+        if new_entries:
+            self.ai_log_text.insert(tk.END, "\n".join(new_entries) + "\n")
         self.ai_log_text.configure(state="disabled")
-        if self.ai_log_visible:
-            self.ai_log_text.see(tk.END)
+        self.ai_log_text.see(tk.END)
+        self._ai_log_rendered = (offset, len(entries))
 
     def _request_ai_refresh(self) -> None:
         if not self.ai_active:
             return
         self._ai_refresh_pending = True
-        if not self._ai_worker_thread or not self._ai_worker_thread.is_alive():
+        if self._ai_future and not self._ai_future.done():
+            # The running worker schedules a relaunch once it finishes.
+            return
+        # Trailing-edge debounce: a burst of ledger changes starts one worker.
+        if self._ai_refresh_after_id is not None:
+            self.after_cancel(self._ai_refresh_after_id)
+        self._ai_refresh_after_id = self.after(
+            AI_REFRESH_DEBOUNCE_MS, self._launch_debounced_ai_worker
+        )
+
+    def _launch_debounced_ai_worker(self) -> None:
+        self._ai_refresh_after_id = None
+        if not self._ai_future or self._ai_future.done():
             self._launch_ai_worker()
 
     def _update_transaction_actions_state(self, _event=None) -> None:
@@ -754,8 +1008,7 @@ class BudgetApp(tk.Tk):
 
         has_selection = bool(self.transaction_table.tree.selection())
         state = "normal" if has_selection else "disabled"
-        if hasattr(self, "search_company_button"):
-            self.search_company_button.configure(state=state)
+        self.search_company_button.configure(state=state)
 
     def _open_company_search(self) -> None:
         """Open a browser window searching Google for the selected transaction's company."""
@@ -792,73 +1045,119 @@ class BudgetApp(tk.Tk):
         webbrowser.open_new(url)
         self._set_status(f"Opened web search for '{query}'.")
 
+    def _get_ai_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop that runs AI classification."""
+
+        if self._ai_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            self._ai_loop = loop
+        return self._ai_loop
+
     def _launch_ai_worker(self) -> None:
         if not self.ai_active or not self._ai_refresh_pending:
             return
-        stop_event = threading.Event()
-        self._ai_stop_event = stop_event
         self._ai_refresh_pending = False
+        cancelled = threading.Event()
+        self._ai_cancelled = cancelled
 
-        def worker() -> None:
+        async def classify() -> dict[str, ClassificationResult]:
             collected: dict[str, ClassificationResult] = {}
 
             def log_message(message: str) -> None:
+                if cancelled.is_set():
+                    return
                 self.viewmodel.add_ai_log_entry(message)
-                self.after(0, self._refresh_ai_log)
-
-            def should_abort() -> bool:
-                return stop_event.is_set() or not self.ai_active
+                self._ai_events.put((cancelled, None))
 
             def handle_suggestion(transaction_id: str, result: ClassificationResult) -> None:
+                if cancelled.is_set():
+                    return
                 collected[transaction_id] = result
-                self.after(
-                    0,
-                    lambda tid=transaction_id, res=result: self._on_partial_ai_suggestion(
-                        tid, res
-                    ),
-                )
+                self._ai_events.put((cancelled, (transaction_id, result)))
 
             try:
-                suggestions = self.viewmodel.suggest_categories_for_unassigned(
+                suggestions = await self.viewmodel.suggest_categories_for_unassigned_async(
                     logger=log_message,
-                    should_abort=should_abort,
+                    should_abort=cancelled.is_set,
                     on_suggestion=handle_suggestion,
                 )
             except Exception as exc:  # noqa: BLE001 - surface unexpected failures
                 self.viewmodel.add_ai_log_entry(f"AI classification error: {exc}")
                 suggestions = {}
             finally:
-                self.after(0, self._refresh_ai_log)
+                self._ai_events.put((cancelled, None))
+            return suggestions or collected
 
-            if should_abort():
-                self.after(0, lambda: self._on_ai_worker_finished(collected, stop_event))
+        future = asyncio.run_coroutine_threadsafe(classify(), self._get_ai_loop())
+        self._ai_future = future
+
+        def on_done(done: Future) -> None:
+            if done.cancelled():
                 return
+            results = done.result()
+            self.after(0, lambda: self._on_ai_worker_finished(results, done))
+
+        future.add_done_callback(on_done)
+        if self._ai_drain_id is None:
+            self._ai_drain_id = self.after(AI_EVENT_DRAIN_MS, self._drain_ai_events)
 
-            final_results = suggestions or collected
-            self.after(0, lambda: self._on_ai_worker_finished(final_results, stop_event))
+    def _drain_ai_events(self) -> None:
+        """Apply queued worker updates, then poll again while a worker is running."""
 
-        thread = threading.Thread(target=worker, daemon=True)
-        self._ai_worker_thread = thread
-        thread.start()
+        self._ai_drain_id = None
+        self._process_ai_events(AI_EVENTS_PER_DRAIN)
+        if self._ai_future is not None:
+            self._ai_drain_id = self.after(AI_EVENT_DRAIN_MS, self._drain_ai_events)
+
+    def _process_ai_events(self, limit: int) -> None:
+        """Apply up to ``limit`` queued updates and refresh the log once for the batch.
+
+        ``None`` payloads mark new log lines; the entries themselves already live
+        in the view model. Updates from a stopped run are discarded unapplied.
+        Anything beyond ``limit`` waits for the next drain so a burst cannot hold
+        the Tk thread.
+        """
+
+        log_changed = False
+        for _ in range(limit):
+            try:
+                cancelled, payload = self._ai_events.get_nowait()
+            except queue.Empty:
+                break
+            if cancelled.is_set():
+                continue
+            if payload is None:
+                log_changed = True
+            else:
+                self._on_partial_ai_suggestion(*payload)
+        if log_changed:
+            self._refresh_ai_log()
 
     def _on_ai_worker_finished(
-        self, suggestions: dict[str, ClassificationResult], stop_event: threading.Event
+        self, suggestions: dict[str, ClassificationResult], future: Future
     ) -> None:
-        if self._ai_stop_event is stop_event and self.ai_active:
-            filtered = {
-                txn_id: result
-                for txn_id, result in suggestions.items()
-                if self._transaction_is_unassigned(txn_id)
-            }
-            self.ai_suggestions = filtered
-            self._suspend_ai_refresh = True
-            self._on_data_changed(self.viewmodel.ledger)
-
-        if self._ai_stop_event is stop_event:
-            self._ai_worker_thread = None
-            self._ai_stop_event = None
-            if self.ai_active and self._ai_refresh_pending:
-                self._launch_ai_worker()
+        if self._ai_future is not future:
+            return
+        # The final results supersede partial updates that are still queued.
+        while not self._ai_events.empty():
+            self._ai_events.get_nowait()
+        self._ai_future = None
+        self._ai_cancelled = None
+        if not self.ai_active:
+            return
+        self.ai_suggestions = {
+            txn_id: result
+            for txn_id, result in suggestions.items()
+            if self._transaction_is_unassigned(txn_id)
+        }
+        self._on_ai_suggestions_changed()
+        self._refresh_ai_log()
+        if self._ai_refresh_pending:
+            # Relaunch through the debounce timer so back-to-back runs are spaced
+            # out and edits made meanwhile share the next run.
+            self._request_ai_refresh()
+
 
 def run_app(data_file: str | None = None) -> None:
     """Convenience helper to start the Tkinter loop."""
@@ -110,6 +110,10 @@ class BudgetLedger:
 
     categories: Dict[str, BudgetCategory] = field(default_factory=dict)
     transactions: List[Transaction] = field(default_factory=list)
+    # Running sums over all categories, kept current by the mutation methods
+    # below; recalculate_actuals() resynchronises them.
+    planned_total: Decimal = field(default=Decimal("0.00"), init=False, compare=False)
+    actual_total: Decimal = field(default=Decimal("0.00"), init=False, compare=False)
 
     def add_category(
         self,
@@ -125,6 +129,7 @@ class BudgetLedger:
             category_id=category_id or uuid4().hex,
         )
         self.categories[category.category_id] = category
+        self.planned_total += category.planned_amount
         return category
 
     def update_category(
@@ -143,12 +148,17 @@ class BudgetLedger:
         if name is not None:
             category.name = name
         if planned_amount is not None:
-            category.planned_amount = _to_decimal(planned_amount)
+            new_amount = _to_decimal(planned_amount)
+            self.planned_total += new_amount - category.planned_amount
+            category.planned_amount = new_amount
         return category
 
     def remove_category(self, category_id: str) -> None:
         """Remove a category and its associated transactions."""
-        self.categories.pop(category_id, None)
+        category = self.categories.pop(category_id, None)
+        if category is not None:
+            self.planned_total -= category.planned_amount
+            self.actual_total -= category.actual_amount
         self.transactions = [
             txn for txn in self.transactions if txn.category_id != category_id
         ]
@@ -188,10 +198,36 @@ class BudgetLedger:
             if category_id not in self.categories:
                 raise KeyError(f"Unknown category id '{category_id}'")
             self.categories[category_id].apply_transaction(transaction)
+            self.actual_total += transaction.amount
         return transaction
 
+    def remove_transaction(self, transaction_id: str) -> None:
+        """Remove a transaction and take it out of its category totals."""
+        kept: List[Transaction] = []
+        for transaction in self.transactions:
+            if transaction.transaction_id == transaction_id:
+                self._unapply(transaction)
+            else:
+                kept.append(transaction)
+        self.transactions = kept
+
+    def assign_category(self, transaction: Transaction, category_id: str) -> None:
+        """Move a transaction to another category, adjusting both totals."""
+        if category_id not in self.categories:
+            raise KeyError(f"Unknown category id '{category_id}'")
+        self._unapply(transaction)
+        transaction.category_id = category_id
+        self.categories[category_id].apply_transaction(transaction)
+        self.actual_total += transaction.amount
+
+    def _unapply(self, transaction: Transaction) -> None:
+        category = self.categories.get(transaction.category_id or "")
+        if category is not None:
+            category.actual_amount -= transaction.amount
+            self.actual_total -= transaction.amount
+
     def recalculate_actuals(self) -> None:
-        """Recompute category actual totals from the transactions list."""
+        """Recompute category actual totals and the running sums from scratch."""
         for category in self.categories.values():
             category.actual_amount = Decimal("0.00")
 
@@ -199,6 +235,15 @@ class BudgetLedger:
             if transaction.category_id and transaction.category_id in self.categories:
                 self.categories[transaction.category_id].apply_transaction(transaction)
 
+        self.planned_total = sum(
+            (category.planned_amount for category in self.categories.values()),
+            Decimal("0.00"),
+        )
+        self.actual_total = sum(
+            (category.actual_amount for category in self.categories.values()),
+            Decimal("0.00"),
+        )
+
     def to_dict(self) -> Dict[str, Iterable[Dict[str, str]]]:
         """Serialise the ledger for storage."""
         return {
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -23,6 +26,35 @@ def load_ledger(data_path: str | Path | None = None) -> BudgetLedger:
 
 def save_ledger(ledger: BudgetLedger, data_path: str | Path | None = None) -> None:
     """Persist budget data to disk as JSON."""
+    save_payload(ledger.to_dict(), data_path)
+
+
+def save_payload(payload: dict[str, Any], data_path: str | Path | None = None) -> None:
+    """Write an already serialised ledger to disk as JSON.
+
+    The data goes to a temporary file next to the target, which then replaces
+    it, so an interrupted save never leaves a truncated budget file behind.
+    """
     path = Path(data_path) if data_path else DEFAULT_DATA_FILE
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(ledger.to_dict(), handle, indent=2)
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    try:
+        # mkstemp creates the file as 0600; keep the permissions a plain write would.
+        os.chmod(temp_name, _target_mode(path))
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _target_mode(path: Path) -> int:
+    """Return the existing file's permissions, or the umask default for a new file."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
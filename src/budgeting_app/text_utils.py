@@ -4,11 +4,9 @@ from __future__ import annotations
 
 import re
 
-_CARD_DETAIL_PATTERNS = (
-    re.compile(r"\bPas:.*", re.IGNORECASE),
-    re.compile(r"\bTerminal:.*", re.IGNORECASE),
-    re.compile(r"\bAppr\s*Cd:.*", re.IGNORECASE),
-)
+# Card metadata ("Pas:", "Terminal:", "Appr Cd:") runs to the end of the segment;
+# one alternation strips from the earliest marker onwards in a single scan.
+_CARD_DETAIL_RE = re.compile(r"\b(?:Pas|Terminal|Appr\s*Cd):.*", re.IGNORECASE)
 
 
 def _clean_segment(segment: str) -> str:
@@ -17,9 +15,8 @@ def _clean_segment(segment: str) -> str:
     cleaned = segment.strip(" -.,")
     if not cleaned:
         return ""
-    for pattern in _CARD_DETAIL_PATTERNS:
-        cleaned = pattern.sub("", cleaned)
-    cleaned = cleaned.strip(" -.,")
+    if ":" in cleaned:
+        cleaned = _CARD_DETAIL_RE.sub("", cleaned).strip(" -.,")
     return cleaned
 
 
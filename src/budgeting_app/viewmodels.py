@@ -5,12 +5,12 @@ from __future__ import annotations
 from dataclasses import asdict
 from decimal import Decimal
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional
 
-from .ai import ClassificationResult, TransactionClassifier
+from .ai import BulkClassificationJob, ClassificationResult, TransactionClassifier
 from .csv_importer import CSVTransaction, read_transactions_from_csv
 from .models import BudgetLedger, BudgetCategory, Transaction
-from .storage import load_ledger, save_ledger
+from .storage import load_ledger, save_ledger, save_payload
 
 ChangeListener = Callable[[BudgetLedger], None]
 
@@ -24,6 +24,8 @@ class BudgetViewModel:
         self._listeners: List[ChangeListener] = []
         self._classifier = TransactionClassifier()
         self._ai_log: List[str] = []
+        self._ai_log_offset = 0  # entries dropped from the front by trims and clears
+        self._bulk_job: Optional[BulkClassificationJob] = None
 
     # ------------------------------------------------------------------ #
     # Persistence
@@ -35,6 +37,14 @@ class BudgetViewModel:
     def save(self) -> None:
         save_ledger(self.ledger, self.data_file)
 
+    def snapshot(self) -> dict[str, Any]:
+        """Serialise the ledger so it can be written without touching live state."""
+        return self.ledger.to_dict()
+
+    def write_snapshot(self, payload: dict[str, Any]) -> None:
+        """Write a payload from :meth:`snapshot`; safe to call off the UI thread."""
+        save_payload(payload, self.data_file)
+
     # ------------------------------------------------------------------ #
     # Listener registration
     # ------------------------------------------------------------------ #
@@ -83,6 +93,10 @@ class BudgetViewModel:
                 "difference": f"{(category.planned_amount - category.actual_amount):.2f}",
             }
 
+    def totals(self) -> tuple[Decimal, Decimal]:
+        """Return the planned and actual totals across all categories."""
+        return self.ledger.planned_total, self.ledger.actual_total
+
     # ------------------------------------------------------------------ #
     # Transaction operations
     # ------------------------------------------------------------------ #
@@ -114,10 +128,7 @@ class BudgetViewModel:
         return transaction
 
     def delete_transaction(self, transaction_id: str) -> None:
-        self.ledger.transactions = [
-            txn for txn in self.ledger.transactions if txn.transaction_id != transaction_id
-        ]
-        self.ledger.recalculate_actuals()
+        self.ledger.remove_transaction(transaction_id)
         self._notify()
 
     def set_transactions_category(
@@ -134,14 +145,13 @@ class BudgetViewModel:
         updated = False
         for txn in self.ledger.transactions:
             if txn.transaction_id in id_set:
-                txn.category_id = category_id
+                self.ledger.assign_category(txn, category_id)
                 updated = True
 
         if not updated:
             missing = ", ".join(sorted(id_set))
             raise KeyError(f"Unknown transaction id '{missing}'")
 
-        self.ledger.recalculate_actuals()
         self._notify()
 
     def set_transaction_category(self, transaction_id: str, category_id: str) -> None:
@@ -169,7 +179,7 @@ class BudgetViewModel:
     # ------------------------------------------------------------------ #
     # AI assisted categorisation
     # ------------------------------------------------------------------ #
-    def suggest_categories_for_unassigned(
+    async def suggest_categories_for_unassigned_async(
         self,
         *,
         logger: Optional[Callable[[str], None]] = None,
@@ -180,25 +190,18 @@ class BudgetViewModel:
     ) -> dict[str, ClassificationResult]:
         """Return AI category suggestions for unassigned transactions.
 
-        When ``on_suggestion`` is provided the callback is invoked from the
-        classification loop as soon as an individual suggestion becomes
-        available, allowing the UI to update incrementally.
+        Every unassigned transaction goes to the classifier in a single call so
+        its batches run concurrently. Suggestions are recorded, and passed to
+        ``on_suggestion``, as each batch completes. Cancel the awaiting task to
+        stop classification; once ``should_abort`` returns true, results that
+        still arrive are not recorded.
         """
 
         log = logger or self._append_ai_log
         if should_abort and should_abort():
             log("AI classification cancelled before starting.")
             return {}
-        existing_names = [category.name for category in self.ledger.categories.values()]
-        categorized_examples: list[tuple[Transaction, str]] = []
-        for txn in self.ledger.transactions:
-            if not txn.category_id:
-                continue
-            category = self.ledger.categories.get(txn.category_id)
-            if not category:
-                continue
-            categorized_examples.append((txn, category.name))
-
+        existing_names, categorized_examples = self._classification_context()
         unassigned = [txn for txn in self.ledger.transactions if not txn.category_id]
         if not unassigned:
             log("No unassigned transactions to classify.")
@@ -208,42 +211,100 @@ class BudgetViewModel:
             f"Attempting to classify {len(unassigned)} unassigned "
             f"transaction{'s' if len(unassigned) != 1 else ''}."
         )
-
         suggestions: dict[str, ClassificationResult] = {}
-        for txn in unassigned:
+
+        def record(index: int, result: Optional[ClassificationResult]) -> None:
             if should_abort and should_abort():
-                log("AI classification cancelled.")
-                break
-            txn_label = txn.description or txn.transaction_id or "(unnamed)"
-            log(f"Requesting suggestion for '{txn_label}'.")
+                return
+            self._record_suggestion(
+                unassigned[index], result, suggestions, log, on_suggestion
+            )
 
-            def txn_logger(message: str, *, txn_id: str = txn.transaction_id) -> None:
-                log(f"[{txn_id}] {message}")
+        await self._classifier.suggest_categories_async(
+            unassigned,
+            existing_names,
+            categorized_examples,
+            logger=log,
+            on_result=record,
+        )
+        return suggestions
 
-            result = self._classifier.suggest_category(
-                txn,
-                existing_names,
-                categorized_examples,
-                logger=txn_logger,
+    @staticmethod
+    def _record_suggestion(
+        txn: Transaction,
+        result: Optional[ClassificationResult],
+        suggestions: dict[str, ClassificationResult],
+        log: Callable[[str], None],
+        on_suggestion: Optional[Callable[[str, ClassificationResult], None]],
+    ) -> None:
+        txn_label = txn.description or txn.transaction_id or "(unnamed)"
+        if result is None:
+            log(f"No suggestion produced for '{txn_label}'.")
+            return
+        suggestions[txn.transaction_id] = result
+        if on_suggestion:
+            on_suggestion(txn.transaction_id, result)
+        log(
+            "Recorded suggestion '{name}' (confidence {confidence:.0%}) for "
+            "transaction '{txn_label}'.".format(
+                name=result.category_name,
+                confidence=result.confidence,
+                txn_label=txn_label,
             )
-            if should_abort and should_abort():
-                log("AI classification cancelled.")
-                break
-            if result is None:
-                log(f"No suggestion produced for '{txn_label}'.")
+        )
+
+    def submit_bulk_classification(self) -> bool:
+        """Queue all unassigned transactions for offline (Batch API) classification.
+
+        Returns ``True`` when a job was submitted.
+        """
+
+        unassigned = [txn for txn in self.ledger.transactions if not txn.category_id]
+        if not unassigned:
+            self._append_ai_log("No unassigned transactions to classify.")
+            return False
+        existing_names, categorized_examples = self._classification_context()
+        self._bulk_job = self._classifier.submit_bulk_classification(
+            unassigned,
+            existing_names,
+            categorized_examples,
+            logger=self._append_ai_log,
+        )
+        return self._bulk_job is not None
+
+    @property
+    def bulk_classification_pending(self) -> bool:
+        return self._bulk_job is not None
+
+    def cancel_bulk_classification(self) -> None:
+        """Forget the pending bulk job without fetching its results."""
+        self._bulk_job = None
+
+    def poll_bulk_classification(self) -> Optional[int]:
+        """Check the pending bulk job; return the number of suggestions once finished."""
+
+        job = self._bulk_job
+        if job is None:
+            return 0
+        results = self._classifier.poll_bulk_classification(job, logger=self._append_ai_log)
+        if results is None:
+            return None
+        self._bulk_job = None
+        return len(results)
+
+    def _classification_context(self) -> tuple[list[str], list[tuple[Transaction, str]]]:
+        """Return existing category names and labelled transactions for the classifier."""
+
+        existing_names = [category.name for category in self.ledger.categories.values()]
+        categorized_examples: list[tuple[Transaction, str]] = []
+        for txn in self.ledger.transactions:
+            if not txn.category_id:
                 continue
-            suggestions[txn.transaction_id] = result
-            if on_suggestion:
-                on_suggestion(txn.transaction_id, result)
-            log(
-                "Recorded suggestion '{name}' (confidence {confidence:.0%}) for "
-                "transaction '{txn_label}'.".format(
-                    name=result.category_name,
-                    confidence=result.confidence,
-                    txn_label=txn_label,
-                )
-            )
-        return suggestions
+            category = self.ledger.categories.get(txn.category_id)
+            if not category:
+                continue
+            categorized_examples.append((txn, category.name))
+        return existing_names, categorized_examples
 
     def accept_ai_suggestion(self, transaction_id: str, category_name: str) -> bool:
         """Apply an AI suggestion and ensure the category exists.
@@ -251,9 +312,10 @@ class BudgetViewModel:
         Returns ``True`` when the category had to be created.
         """
 
+        wanted = category_name.lower()
         category_id = None
         for cid, category in self.ledger.categories.items():
-            if category.name.lower() == category_name.lower():
+            if category.name.lower() == wanted:
                 category_id = cid
                 break
 
@@ -270,18 +332,31 @@ class BudgetViewModel:
     # AI log helpers
     # ------------------------------------------------------------------ #
     def clear_ai_log(self) -> None:
-        self._ai_log.clear()
+        self._ai_log_offset += len(self._ai_log)
+        self._ai_log = []
 
     def get_ai_log(self) -> List[str]:
         return list(self._ai_log)
 
+    def get_ai_log_window(self) -> tuple[int, List[str]]:
+        """Return the log entries and how many earlier entries have been dropped.
+
+        While the offset is unchanged, entries past the ones a caller has already
+        shown are new, so the caller can append them instead of redrawing.
+        """
+        # Read the list before the offset: writers bump the offset first.
+        entries = list(self._ai_log)
+        return self._ai_log_offset, entries
+
     def add_ai_log_entry(self, message: str) -> None:
         self._append_ai_log(message)
 
     def _append_ai_log(self, message: str) -> None:
         self._ai_log.append(message)
-        # Keep the log to a sensible size for the UI widget.
-        if len(self._ai_log) > 500:
+        # Keep the log to a sensible size for the UI widget. Trim in chunks so
+        # the widget can append between trims instead of redrawing every time.
+        if len(self._ai_log) > 600:
+            self._ai_log_offset += len(self._ai_log) - 500
             self._ai_log = self._ai_log[-500:]
 
     # ------------------------------------------------------------------ #
@@ -302,8 +377,32 @@ class BudgetViewModel:
         skip_existing: bool = True,
     ) -> int:
         """Import transactions from a Rabobank CSV export."""
+        return self.import_csv_transactions(
+            self.read_csv_transactions(path),
+            category_by_account=category_by_account,
+            default_category_id=default_category_id,
+            skip_existing=skip_existing,
+        )
+
+    @staticmethod
+    def read_csv_transactions(path: str | Path) -> List[CSVTransaction]:
+        """Parse a Rabobank CSV export without touching the ledger.
+
+        This does the file I/O and parsing only, so it is safe to run on a worker
+        thread; pass the result to :meth:`import_csv_transactions` on the UI thread.
+        """
+        return list(read_transactions_from_csv(path))
+
+    def import_csv_transactions(
+        self,
+        csv_transactions: List[CSVTransaction],
+        *,
+        category_by_account: Optional[dict[str, str]] = None,
+        default_category_id: Optional[str] = None,
+        skip_existing: bool = True,
+    ) -> int:
+        """Record parsed CSV transactions in the ledger."""
         category_by_account = category_by_account or {}
-        csv_transactions = list(read_transactions_from_csv(path))
         if not csv_transactions:
             return 0
 
@@ -81,6 +81,9 @@ class Table(ttk.Frame):
         }
         self._sort_column: str | None = None
         self._sort_reverse = False
+        self._rows: dict[str, tuple[str, ...]] = {}
+        # Rows whose displayed values differ from _rows because of set_cells.
+        self._overridden: dict[str, tuple[str, ...]] = {}
         column_options = column_options or {}
         for column in columns:
             anchor = "e" if column in {"planned", "actual", "difference", "amount"} else "w"
@@ -96,14 +99,59 @@ class Table(ttk.Frame):
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
 
-    def populate(self, rows: list[dict[str, str]], *, key_field: str) -> None:
-        """Populate the tree with data dictionaries."""
-        self.tree.delete(*self.tree.get_children())
-        for row in rows:
-            item_id = row.get(key_field, "")
-            values = [row.get(column, "") for column in self.tree["columns"]]
-            self.tree.insert("", "end", iid=item_id, values=values)
-        self._apply_sort()
+    def populate(self, rows: list[dict[str, str]], *, key_field: str) -> set[str]:
+        """Populate the tree with data dictionaries.
+
+        Only rows that were added, removed or changed since the previous call are
+        touched in the Treeview. Returns the ids of rows whose values were written.
+        """
+        columns = self._columns
+        new_rows = {
+            row.get(key_field, ""): tuple(row.get(column, "") for column in columns)
+            for row in rows
+        }
+        previous = self._rows
+        overridden = self._overridden
+        written: set[str] = set()
+        removed = [item_id for item_id in previous if item_id not in new_rows]
+        if removed:
+            self.tree.delete(*removed)
+            for item_id in removed:
+                overridden.pop(item_id, None)
+        for item_id, values in new_rows.items():
+            current = previous.get(item_id)
+            if current is None:
+                self.tree.insert("", "end", iid=item_id, values=values)
+                written.add(item_id)
+            elif current != values:
+                self.tree.item(item_id, values=values)
+                overridden.pop(item_id, None)
+                written.add(item_id)
+        self._rows = new_rows
+
+        order = list(new_rows)
+        if self._sort_column:
+            self._apply_sort(order)
+        elif list(self.tree.get_children("")) != order:
+            for position, item_id in enumerate(order):
+                self.tree.move(item_id, "", position)
+        return written
+
+    def set_cells(self, item_id: str, values: Mapping[str, str]) -> None:
+        """Overwrite several cells of a populated row with a single Treeview call.
+
+        Cells not named in ``values`` are reset to the row's populated values.
+        Raises ``KeyError`` for rows that were not populated.
+        """
+        row = self._rows[item_id]
+        displayed = tuple(
+            values.get(column, current) for column, current in zip(self._columns, row)
+        )
+        self.tree.item(item_id, values=displayed)
+        if displayed == row:
+            self._overridden.pop(item_id, None)
+        else:
+            self._overridden[item_id] = displayed
 
     def bind_double_click(self, callback) -> None:
         self.tree.bind("<Double-1>", callback)
@@ -116,22 +164,29 @@ class Table(ttk.Frame):
             self._sort_reverse = False
         self._apply_sort()
 
-    def _apply_sort(self) -> None:
+    def _apply_sort(self, children: list[str] | None = None) -> None:
         if not self._sort_column:
             self._update_heading_indicators()
             return
-        self._sort_items()
+        self._sort_items(children)
         self._update_heading_indicators()
 
-    def _sort_items(self) -> None:
+    def _sort_items(self, children: list[str] | None = None) -> None:
+        """Sort rows by the active column; ties keep the order of ``children``."""
         column = self._sort_column
         if not column:
             return
-        children = list(self.tree.get_children(""))
+        current_order = list(self.tree.get_children(""))
+        if children is None:
+            children = current_order
+        # Read cell values from the Python-side mirror rather than one Tcl call per row.
+        column_index = self._columns.index(column)
+        rows = self._rows
+        overridden = self._overridden
         non_empty: list[tuple[tuple[int, object], int, str]] = []
         empty: list[tuple[int, str]] = []
         for index, item_id in enumerate(children):
-            value = self.tree.set(item_id, column)
+            value = (overridden.get(item_id) or rows[item_id])[column_index]
             if value is None or str(value).strip() == "":
                 empty.append((index, item_id))
                 continue
@@ -140,6 +195,8 @@ class Table(ttk.Frame):
         non_empty.sort(key=lambda entry: entry[0], reverse=self._sort_reverse)
         ordered = [item_id for _, _, item_id in non_empty]
         ordered.extend(item_id for _, item_id in empty)
+        if ordered == current_order:
+            return
         for position, item_id in enumerate(ordered):
             self.tree.move(item_id, "", position)
 
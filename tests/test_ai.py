@@ -0,0 +1,185 @@
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+
+from budgeting_app import ai
+from budgeting_app.ai import _BATCH_RESPONSE_FORMAT, TransactionClassifier
+from budgeting_app.models import Transaction
+
+
+def test_extract_json_skips_unbalanced_bracket_in_prose() -> None:
+    message = 'Answer (in brackets [x): {"category": "A", "confidence": 0.5}'
+
+    assert TransactionClassifier._extract_json(message) == {
+        "category": "A",
+        "confidence": 0.5,
+    }
+
+
+def test_parse_response_unwraps_single_element_array() -> None:
+    result = TransactionClassifier._parse_response('[{"category":"A","confidence":0.5}]')
+
+    assert result is not None
+    assert result.category_name == "A"
+    assert result.confidence == 0.5
+
+
+def test_keyword_heuristic_prefers_earliest_map_entry() -> None:
+    classifier = TransactionClassifier()
+    transaction = Transaction(description="Uber Eats restaurant", amount="-12.50")
+
+    result = classifier._match_from_keywords(transaction, ["Transport", "Dining"])
+
+    assert result is not None
+    assert result.category_name == "Transport"
+
+
+def _transactions(count: int) -> list[Transaction]:
+    return [Transaction(description=f"Zqxv {index}", amount="-1.00") for index in range(count)]
+
+
+def _batch_size(prompt: str) -> int:
+    return len(re.findall(r"^\[\d+\] ", prompt, flags=re.MULTILINE))
+
+
+def _completion(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class _StubCompletions:
+    """Answer every batch request with one result per transaction in the prompt."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict] = []
+
+    def reply(self, request: dict) -> SimpleNamespace:
+        self.requests.append(request)
+        call = len(self.requests)
+        size = _batch_size(request["messages"][-1]["content"])
+        results = [
+            {"index": index, "category": f"Batch {call}", "confidence": 0.9}
+            for index in range(size)
+        ]
+        return _completion(json.dumps({"results": results}))
+
+    def create(self, **request: object) -> SimpleNamespace:
+        return self.reply(request)
+
+
+def _classifier_with(completions: object, **kwargs: object) -> TransactionClassifier:
+    classifier = TransactionClassifier(**kwargs)
+    classifier._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return classifier
+
+
+def test_parse_batch_response_drops_out_of_range_and_duplicate_indices() -> None:
+    message = json.dumps(
+        {
+            "results": [
+                {"index": 0, "category": "A", "confidence": 0.4},
+                {"index": 0, "category": "B", "confidence": 0.9},
+                {"index": 3, "category": "C", "confidence": 0.9},
+                {"index": -1, "category": "D", "confidence": 0.9},
+                {"category": "E", "confidence": 0.9},
+                {"index": 2, "category": "F", "confidence": 0.6},
+            ]
+        }
+    )
+
+    results = TransactionClassifier._parse_batch_response(message, 3)
+
+    assert sorted(results) == [0, 2]
+    assert results[0].category_name == "A"
+    assert results[2].category_name == "F"
+
+
+def test_parse_batch_response_accepts_bare_array_and_results_wrapper() -> None:
+    entries = [{"index": 1, "category": "A", "confidence": 0.5}]
+
+    bare = TransactionClassifier._parse_batch_response(json.dumps(entries), 2)
+    wrapped = TransactionClassifier._parse_batch_response(json.dumps({"results": entries}), 2)
+
+    assert bare == wrapped
+    assert list(bare) == [1]
+
+
+def test_suggest_categories_splits_rows_into_batches() -> None:
+    completions = _StubCompletions()
+    classifier = _classifier_with(completions, batch_size=20)
+
+    results = classifier.suggest_categories(_transactions(46), ["Misc"], [])
+
+    sizes = [_batch_size(request["messages"][-1]["content"]) for request in completions.requests]
+    assert sizes == [20, 20, 6]
+    assert [result.category_name for result in results] == (
+        ["Batch 1"] * 20 + ["Batch 2"] * 20 + ["Batch 3"] * 6
+    )
+
+
+def test_suggest_categories_leaves_gaps_for_short_result_list() -> None:
+    def create(**request: object) -> SimpleNamespace:
+        return _completion('[{"index": 1, "category": "Misc", "confidence": 0.8}]')
+
+    classifier = _classifier_with(SimpleNamespace(create=create))
+
+    results = classifier.suggest_categories(_transactions(3), ["Misc"], [])
+
+    assert results[0] is None
+    assert results[1] is not None and results[1].category_name == "Misc"
+    assert results[2] is None
+
+
+def test_batch_requests_use_structured_outputs_only_when_enabled() -> None:
+    structured = _StubCompletions()
+    _classifier_with(structured).suggest_categories(_transactions(2), ["Misc"], [])
+    plain = _StubCompletions()
+    _classifier_with(plain, structured_outputs=False).suggest_categories(
+        _transactions(2), ["Misc"], []
+    )
+
+    assert structured.requests[0]["response_format"] == _BATCH_RESPONSE_FORMAT
+    assert "response_format" not in plain.requests[0]
+
+
+def test_suggest_categories_async_keeps_order_and_reports_each_index(monkeypatch) -> None:
+    completions = _StubCompletions()
+
+    async def create(**request: object) -> SimpleNamespace:
+        response = completions.reply(request)
+        # Let later batches finish first so results arrive out of order.
+        await asyncio.sleep(0.01 * (4 - len(completions.requests)))
+        return response
+
+    async def close() -> None:
+        pass
+
+    def async_client(**_kwargs: object) -> SimpleNamespace:
+        return SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create)), close=close
+        )
+
+    class APIError(Exception):
+        pass
+
+    monkeypatch.setattr(
+        ai, "_openai_module", SimpleNamespace(AsyncOpenAI=async_client, APIError=APIError)
+    )
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    classifier = _classifier_with(SimpleNamespace(), batch_size=2)
+    reported: list[int] = []
+
+    results = asyncio.run(
+        classifier.suggest_categories_async(
+            _transactions(5),
+            ["Misc"],
+            [],
+            on_result=lambda index, _result: reported.append(index),
+        )
+    )
+
+    assert sorted(reported) == [0, 1, 2, 3, 4]
+    assert reported != [0, 1, 2, 3, 4]
+    names = [result.category_name for result in results]
+    assert names[0] == names[1] and names[2] == names[3]
+    assert len({names[0], names[2], names[4]}) == 3
@@ -0,0 +1,38 @@
+from decimal import Decimal
+
+from budgeting_app.models import BudgetLedger
+
+
+def test_running_totals_match_recalculation_after_mixed_edits() -> None:
+    ledger = BudgetLedger()
+    groceries = ledger.add_category("Groceries", "300.00")
+    dining = ledger.add_category("Dining", "120.00")
+    travel = ledger.add_category("Travel", "500.00")
+
+    weekly_shop = ledger.record_transaction(
+        description="Weekly shop", amount="-82.40", category_id=groceries.category_id
+    )
+    ledger.record_transaction(
+        description="Cafe", amount="-6.20", category_id=dining.category_id
+    )
+    flight = ledger.record_transaction(
+        description="Flight", amount="-240.00", category_id=travel.category_id
+    )
+    refund = ledger.record_transaction(
+        description="Refund", amount="15.00", category_id=None
+    )
+
+    ledger.update_category(dining.category_id, planned_amount="150.00")
+    ledger.assign_category(weekly_shop, dining.category_id)
+    ledger.assign_category(refund, travel.category_id)
+    ledger.remove_transaction(flight.transaction_id)
+    ledger.record_transaction(
+        description="Hotel", amount="-180.00", category_id=travel.category_id
+    )
+    ledger.remove_category(travel.category_id)
+
+    planned, actual = ledger.planned_total, ledger.actual_total
+    ledger.recalculate_actuals()
+
+    assert planned == ledger.planned_total == Decimal("450.00")
+    assert actual == ledger.actual_total == Decimal("-88.60")
@@ -0,0 +1,30 @@
+import json
+import os
+import stat
+
+import pytest
+
+from budgeting_app.storage import save_payload
+
+
+def test_failed_save_keeps_original_file(tmp_path) -> None:
+    path = tmp_path / "budget.json"
+    save_payload({"categories": [], "transactions": []}, path)
+    original = path.read_text(encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        save_payload({"categories": [object()]}, path)
+
+    assert path.read_text(encoding="utf-8") == original
+    assert os.listdir(tmp_path) == ["budget.json"]
+
+
+def test_save_keeps_existing_file_permissions(tmp_path) -> None:
+    path = tmp_path / "budget.json"
+    path.write_text("{}", encoding="utf-8")
+    path.chmod(0o644)
+
+    save_payload({"categories": []}, path)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    assert json.loads(path.read_text(encoding="utf-8")) == {"categories": []}
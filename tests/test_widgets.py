@@ -0,0 +1,87 @@
+from budgeting_app.widgets import Table
+
+
+class _FakeTree:
+    """Record the Treeview calls made by ``Table`` without needing a display."""
+
+    def __init__(self) -> None:
+        self.items: dict[str, tuple[str, ...]] = {}
+        self.order: list[str] = []
+        self.calls: list[tuple[str, str]] = []
+
+    def get_children(self, _parent: str = "") -> tuple[str, ...]:
+        return tuple(self.order)
+
+    def insert(self, _parent: str, _index: str, *, iid: str, values: tuple[str, ...]) -> None:
+        self.calls.append(("insert", iid))
+        self.items[iid] = tuple(values)
+        self.order.append(iid)
+
+    def item(self, iid: str, *, values: tuple[str, ...]) -> None:
+        self.calls.append(("item", iid))
+        self.items[iid] = tuple(values)
+
+    def delete(self, *iids: str) -> None:
+        for iid in iids:
+            self.calls.append(("delete", iid))
+            del self.items[iid]
+            self.order.remove(iid)
+
+    def move(self, iid: str, _parent: str, index: int) -> None:
+        self.order.remove(iid)
+        self.order.insert(index, iid)
+
+
+def _table() -> Table:
+    table = object.__new__(Table)
+    table.tree = _FakeTree()
+    table._columns = ("name", "amount")
+    table._base_headings = {}
+    table._sort_column = None
+    table._sort_reverse = False
+    table._rows = {}
+    table._overridden = {}
+    return table
+
+
+def _row(item_id: str, name: str, amount: str = "1.00") -> dict[str, str]:
+    return {"id": item_id, "name": name, "amount": amount}
+
+
+def test_populate_only_touches_changed_rows() -> None:
+    table = _table()
+    assert table.populate([_row("a", "Rent"), _row("b", "Food")], key_field="id") == {"a", "b"}
+    table.tree.calls.clear()
+
+    written = table.populate(
+        [_row("a", "Rent"), _row("b", "Groceries"), _row("c", "Fuel")], key_field="id"
+    )
+
+    assert written == {"b", "c"}
+    assert table.tree.calls == [("item", "b"), ("insert", "c")]
+    assert table.tree.items["b"] == ("Groceries", "1.00")
+    assert table.tree.order == ["a", "b", "c"]
+
+
+def test_populate_deletes_missing_rows() -> None:
+    table = _table()
+    table.populate([_row("a", "Rent"), _row("b", "Food")], key_field="id")
+    table.tree.calls.clear()
+
+    written = table.populate([_row("b", "Food")], key_field="id")
+
+    assert written == set()
+    assert table.tree.calls == [("delete", "a")]
+    assert table.tree.order == ["b"]
+
+
+def test_populate_clears_overrides_of_rewritten_and_removed_rows() -> None:
+    table = _table()
+    table.populate([_row("a", "Rent"), _row("b", "Food")], key_field="id")
+    table.set_cells("a", {"name": "Rent (suggested)"})
+    table.set_cells("b", {"name": "Food (suggested)"})
+
+    table.populate([_row("a", "Housing")], key_field="id")
+
+    assert table._overridden == {}
+    assert table.tree.items["a"] == ("Housing", "1.00")